@@ -1,70 +1,718 @@
+"""Static detection of event-loop blocking calls inside coroutines.
+
+Each file is parsed once and walked by a single ``ast.NodeVisitor``. Call
+targets are resolved through the module's imports (``from time import sleep``
+is reported as ``time.sleep``) and checked against a registry of rules. Only
+calls that execute directly in an ``async def`` body are reported; sync
+helpers defined in the same module are followed, so a coroutine calling a
+local ``def`` that sleeps is reported at the call site.
+
+Project scans skip ignored and vendored directories, run on a process pool
+and keep per-file results in an on-disk cache keyed by size, mtime and
+content hash. Each file also yields a summary of its module-level helpers
+and of the project functions its coroutines call; the scan joins these into
+a project-wide map, so a helper imported from another module
+(``from app.core.auth import verify_password``) is followed too.
+"""
+
+import abc
+
+import ast
+import bisect
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-
-def analyze_async_patterns(code: str) -> List[str]:
-    """Analyze the provided code for potential async/sync pitfalls."""
-    issues = []
-    
-    # Check for blocking calls in async functions
-    if "time.sleep" in code:
-        issues.append("Blocking call 'time.sleep' found in async function. Consider using 'await asyncio.sleep' instead.")
-    
-    # Check for synchronous functions in async context
-    if "def " in code and "async def" not in code:
-        issues.append("Synchronous function defined in async context. Ensure proper usage of async functions.")
-    
-    # Additional checks can be added here
-    
-    return issues
-
-
-def analyze_file(file_path: Path) -> List[str]:
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from .utils import get_cache_dir, iter_project_files, logger
+
+# Bump when the engine changes in a way that invalidates cached scan results
+CACHE_VERSION = "2"
+ASYNC_DEF = re.compile(r"\basync\s+def\b")
+ASYNC_DEF_BYTES = re.compile(rb"\basync\s+def\b")
+# Below this many files to analyze, process-pool startup costs more than it saves
+PARALLEL_THRESHOLD = 200
+
+
+class Finding(NamedTuple):
+    """A blocking call found inside a coroutine."""
+
+    path: str
+    line: int
+    col: int
+    rule: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}:{self.col}: [{self.rule}] {self.message}"
+
+
+class Rule(abc.ABC):
+    """Base class for blocking-call rules.
+
+    ``match`` receives the call node, its import-resolved dotted name (or None
+    when the target is not a plain name/attribute chain) and the kind of the
+    receiver object, if known. It returns a message when the call blocks.
+    """
+
+    name = "blocking-call"
+
+    @abc.abstractmethod
+    def match(self, call: ast.Call, qualname: Optional[str], receiver_kind: Optional[str]) -> Optional[str]:
+        """Return a message when ``call`` blocks, else None."""
+
+
+class CallRule(Rule):
+    """Matches calls by resolved dotted name; patterns may use ``*`` wildcards."""
+
+    def __init__(self, name: str, patterns: Iterable[str], message: str):
+        self.name = name
+        self.patterns = tuple(patterns)
+        self.message = message
+        self._regex = re.compile("|".join(fnmatch.translate(pattern) for pattern in self.patterns))
+
+    def match(self, call, qualname, receiver_kind):
+        if qualname and self._regex.match(qualname):
+            return self.message.format(name=qualname)
+        return None
+
+
+class MethodRule(Rule):
+    """Matches ``obj.method()`` calls, optionally only on receivers of a tracked kind."""
+
+    def __init__(self, name: str, methods: Iterable[str], message: str, kind: Optional[str] = None):
+        self.name = name
+        self.methods = frozenset(methods)
+        self.message = message
+        self.kind = kind
+
+    def match(self, call, qualname, receiver_kind):
+        if not isinstance(call.func, ast.Attribute) or call.func.attr not in self.methods:
+            return None
+        if self.kind is not None and receiver_kind != self.kind:
+            return None
+        return self.message.format(name=qualname or call.func.attr)
+
+
+# Constructors and annotations that give a variable a kind MethodRules can target
+TRACKED_KINDS: Dict[str, str] = {
+    "sqlalchemy.orm.Session": "sqlalchemy.Session",
+    "sqlalchemy.orm.session.Session": "sqlalchemy.Session",
+    "passlib.context.CryptContext": "passlib.CryptContext",
+    "requests.Session": "requests.Session",
+    "requests.sessions.Session": "requests.Session",
+}
+
+RULES: List[Rule] = []
+
+
+def register_rule(rule: Rule) -> Rule:
+    """Add a rule to the default registry used by the analyzer."""
+    RULES.append(rule)
+    return rule
+
+
+register_rule(CallRule(
+    "time-sleep",
+    ["time.sleep"],
+    "Blocking call '{name}' inside coroutine. Use 'await asyncio.sleep' instead.",
+))
+register_rule(CallRule(
+    "sync-http",
+    ["requests.*", "urllib.request.urlopen"],
+    "Blocking HTTP call '{name}' inside coroutine. Use an async client such as httpx.AsyncClient.",
+))
+register_rule(MethodRule(
+    "sync-http",
+    ["get", "post", "put", "patch", "delete", "head", "options", "request"],
+    "Blocking HTTP call '{name}' on a requests.Session inside coroutine. Use httpx.AsyncClient.",
+    kind="requests.Session",
+))
+register_rule(CallRule(
+    "sync-file-io",
+    ["open", "io.open", "os.read", "os.write", "shutil.copy*", "shutil.move", "shutil.rmtree"],
+    "Blocking file I/O '{name}' inside coroutine. Use aiofiles or run it in a thread.",
+))
+register_rule(MethodRule(
+    "sync-file-io",
+    ["read_text", "write_text", "read_bytes", "write_bytes"],
+    "Blocking file I/O '{name}' inside coroutine. Use aiofiles or run it in a thread.",
+))
+register_rule(CallRule(
+    "subprocess",
+    ["subprocess.run", "subprocess.call", "subprocess.check_call", "subprocess.check_output", "os.system"],
+    "Blocking subprocess call '{name}' inside coroutine. Use asyncio.create_subprocess_exec.",
+))
+register_rule(MethodRule(
+    "sync-sqlalchemy",
+    ["query", "execute", "scalar", "scalars", "get", "commit", "flush", "refresh", "merge"],
+    "Blocking database call '{name}' on a sync SQLAlchemy Session inside coroutine. "
+    "Use AsyncSession or a sync 'def' route.",
+    kind="sqlalchemy.Session",
+))
+register_rule(MethodRule(
+    "password-hashing",
+    ["hash", "verify", "verify_and_update"],
+    "CPU-bound password hashing '{name}' inside coroutine. Offload it to a thread pool.",
+    kind="passlib.CryptContext",
+))
+register_rule(CallRule(
+    "password-hashing",
+    ["bcrypt.hashpw", "bcrypt.checkpw", "passlib.hash.*.hash", "passlib.hash.*.verify"],
+    "CPU-bound password hashing '{name}' inside coroutine. Offload it to a thread pool.",
+))
+
+
+class _Scope:
+    __slots__ = ("name", "is_async", "checked", "kinds", "blocking", "local_calls", "imported_calls")
+
+    def __init__(self, name: str, is_async: bool, checked: bool = False):
+        self.name = name
+        self.is_async = is_async
+        # Calls are only matched in coroutines and in module-level sync helpers
+        self.checked = checked or is_async
+        self.kinds: Dict[str, str] = {}
+        self.blocking: Optional[str] = None
+        self.local_calls: List[ast.Call] = []
+        # Absolute names of imported functions called here, for project-wide resolution
+        self.imported_calls: List[str] = []
+
+
+class BlockingCallVisitor(ast.NodeVisitor):
+    """Walks a module once and collects blocking calls made from coroutines."""
+
+    def __init__(self, path: str, rules: Optional[List[Rule]] = None, async_lines: Optional[List[int]] = None,
+                 module: Optional[str] = None):
+        self.path = path
+        # Dotted module name within the project; enables summary()
+        self.module = module
+        self.package = module if os.path.basename(path) == "__init__.py" else (module or "").rpartition(".")[0]
+        self.rules = RULES if rules is None else rules
+        # Sorted line numbers holding an 'async def'; lets unchecked subtrees be skipped
+        self.async_lines = async_lines
+        self.findings: List[Finding] = []
+        self.aliases: Dict[str, str] = {}
+        self.scopes: List[_Scope] = [_Scope("<module>", False)]
+        self._awaited: Set[int] = set()
+        # Module-level sync functions, keyed by name, whose blocking calls are followed
+        self._helpers: Dict[str, _Scope] = {}
+        self._pending: List[tuple] = []
+        # Coroutine calls that only the project-wide pass can resolve: (coroutine, call, target)
+        self._unresolved: List[tuple] = []
+
+    def run(self, tree: ast.AST) -> List[Finding]:
+        self.visit(tree)
+        self._resolve_local_helpers()
+        self.findings.sort(key=lambda finding: (finding.line, finding.col))
+        return self.findings
+
+    # Imports -------------------------------------------------------------
+
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            if alias.asname:
+                self.aliases[alias.asname] = alias.name
+            else:
+                top = alias.name.split(".", 1)[0]
+                self.aliases[top] = top
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        prefix = "." * node.level + (f"{node.module}." if node.module else "")
+        for alias in node.names:
+            if alias.name != "*":
+                self.aliases[alias.asname or alias.name] = prefix + alias.name
+
+    # Scopes --------------------------------------------------------------
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._visit_function(node, is_async=False)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        self._visit_function(node, is_async=True)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        if not self._may_contain_async(node):
+            return
+        self.scopes.append(_Scope(node.name, False))
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def visit_Lambda(self, node: ast.Lambda):
+        self.scopes.append(_Scope("<lambda>", False))
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def _visit_function(self, node, is_async: bool):
+        for decorator in node.decorator_list:
+            self.visit(decorator)
+        for default in node.args.defaults + [d for d in node.args.kw_defaults if d is not None]:
+            self.visit(default)
+
+        is_module_level = len(self.scopes) == 1
+        scope = _Scope(node.name, is_async, checked=is_module_level)
+        if not scope.checked and not self._may_contain_async(node):
+            return
+        for arg in node.args.posonlyargs + node.args.args + node.args.kwonlyargs:
+            kind = self._kind_of(arg.annotation) if arg.annotation is not None else None
+            if kind:
+                scope.kinds[arg.arg] = kind
+
+        self.scopes.append(scope)
+        for statement in node.body:
+            self.visit(statement)
+        self.scopes.pop()
+
+        if is_module_level and not is_async:
+            self._helpers[node.name] = scope
+
+    def _may_contain_async(self, node: ast.AST) -> bool:
+        if self.async_lines is None:
+            return True
+        index = bisect.bisect_left(self.async_lines, node.lineno)
+        return index < len(self.async_lines) and self.async_lines[index] <= node.end_lineno
+
+    # Kind tracking -------------------------------------------------------
+
+    def visit_Assign(self, node: ast.Assign):
+        self.generic_visit(node)
+        kind = self._kind_of(node.value.func) if isinstance(node.value, ast.Call) else None
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                if kind:
+                    self.scopes[-1].kinds[target.id] = kind
+                else:
+                    self.scopes[-1].kinds.pop(target.id, None)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        self.generic_visit(node)
+        if isinstance(node.target, ast.Name):
+            kind = self._kind_of(node.annotation)
+            if kind:
+                self.scopes[-1].kinds[node.target.id] = kind
+
+    def _kind_of(self, node: ast.AST) -> Optional[str]:
+        qualname = self._qualname(node)
+        return TRACKED_KINDS.get(qualname) if qualname else None
+
+    def _receiver_kind(self, call: ast.Call) -> Optional[str]:
+        if not isinstance(call.func, ast.Attribute) or not isinstance(call.func.value, ast.Name):
+            return None
+        name = call.func.value.id
+        for scope in reversed(self.scopes):
+            if name in scope.kinds:
+                return scope.kinds[name]
+        return None
+
+    # Calls ---------------------------------------------------------------
+
+    def visit_Await(self, node: ast.Await):
+        if isinstance(node.value, ast.Call):
+            self._awaited.add(id(node.value))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        scope = self.scopes[-1]
+        if scope.checked and id(node) not in self._awaited:
+            qualname = self._qualname(node.func)
+            receiver_kind = self._receiver_kind(node)
+            for rule in self.rules:
+                message = rule.match(node, qualname, receiver_kind)
+                if message:
+                    self._report(scope, node, rule.name, message)
+                    break
+            else:
+                if isinstance(node.func, ast.Name) and node.func.id not in self.aliases:
+                    scope.local_calls.append(node)
+                    if scope.is_async:
+                        self._pending.append((scope.name, node))
+                elif self.module is not None:
+                    target = self._imported_target(node.func, qualname)
+                    if target is not None:
+                        scope.imported_calls.append(target)
+                        if scope.is_async:
+                            self._unresolved.append((scope.name, node, target))
+        self.generic_visit(node)
+
+    def _report(self, scope: _Scope, node: ast.Call, rule: str, message: str):
+        if scope.is_async:
+            self.findings.append(Finding(self.path, node.lineno, node.col_offset, rule, message))
+        elif scope.blocking is None:
+            scope.blocking = rule
+
+    def _resolve_local_helpers(self):
+        """Report coroutine calls to same-module sync functions that block."""
+        changed = True
+        while changed:
+            changed = False
+            for helper in self._helpers.values():
+                if helper.blocking is not None:
+                    continue
+                for call in helper.local_calls:
+                    callee = self._helpers.get(call.func.id)
+                    if callee is not None and callee is not helper and callee.blocking is not None:
+                        helper.blocking = callee.blocking
+                        changed = True
+                        break
+
+        for coroutine, call in self._pending:
+            helper = self._helpers.get(call.func.id)
+            if helper is not None and helper.blocking is not None:
+                self.findings.append(Finding(
+                    self.path, call.lineno, call.col_offset, helper.blocking,
+                    _helper_message(coroutine, helper.name),
+                ))
+            elif helper is not None and self.module is not None:
+                # It may still block through a helper imported from another module
+                self._unresolved.append((coroutine, call, f"{self.module}.{helper.name}"))
+
+    def summary(self) -> Optional[dict]:
+        """This module's helpers and unresolved coroutine calls, for the project-wide pass.
+
+        ``helpers`` maps each module-level sync function to its blocking rule (or
+        None) and the absolute names of the functions it calls; ``calls`` lists
+        ``(line, col, coroutine, target)`` for coroutine calls to project
+        functions that were not resolved here.
+        """
+        if self.module is None:
+            return None
+        helpers = {}
+        for name, helper in self._helpers.items():
+            callees = set(helper.imported_calls)
+            callees.update(f"{self.module}.{call.func.id}" for call in helper.local_calls)
+            helpers[f"{self.module}.{name}"] = [helper.blocking, sorted(callees)]
+        calls = [[call.lineno, call.col_offset, coroutine, target] for coroutine, call, target in self._unresolved]
+        return {"helpers": helpers, "calls": calls}
+
+    def _imported_target(self, func: ast.AST, qualname: Optional[str]) -> Optional[str]:
+        """The absolute dotted name of an imported function, or None for other calls."""
+        node = func
+        while isinstance(node, ast.Attribute):
+            node = node.value
+        if qualname is None or not isinstance(node, ast.Name) or node.id not in self.aliases:
+            return None
+        if not qualname.startswith("."):
+            return qualname
+        relative = qualname.lstrip(".")
+        level = len(qualname) - len(relative)
+        parts = self.package.split(".") if self.package else []
+        if level - 1 > len(parts):
+            return None
+        return ".".join(parts[: len(parts) - (level - 1)] + [relative])
+
+    def _qualname(self, node: ast.AST) -> Optional[str]:
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        parts.append(self.aliases.get(node.id, node.id))
+        return ".".join(reversed(parts))
+
+
+def _helper_message(coroutine: str, helper: str) -> str:
+    return (
+        f"Coroutine '{coroutine}' calls blocking function '{helper}'. "
+        f"Run it with 'await run_in_threadpool(...)' or make it async."
+    )
+
+
+def analyze_async_patterns(code: str, filename: str = "<string>", rules: Optional[List[Rule]] = None) -> List[Finding]:
+    """Analyze the provided code for blocking calls made inside coroutines."""
+    findings, _ = _analyze(code, filename, rules)
+    return findings
+
+
+def _analyze(code: str, filename: str, rules: Optional[List[Rule]], module: Optional[str] = None):
+    """Return (findings, summary) for one module; the summary is None without a module name."""
+    try:
+        tree = ast.parse(code, filename=filename)
+    except SyntaxError as e:
+        error = Finding(filename, e.lineno or 0, e.offset or 0, "syntax-error", f"Could not parse file: {e.msg}")
+        return [error], None
+    async_lines = [
+        number for number, line in enumerate(code.splitlines(), 1) if "async" in line and ASYNC_DEF.search(line)
+    ]
+    visitor = BlockingCallVisitor(filename, rules, async_lines, module)
+    return visitor.run(tree), visitor.summary()
+
+
+def analyze_file(file_path: Path, rules: Optional[List[Rule]] = None) -> List[Finding]:
     """Analyze a Python file for async/sync issues."""
-    issues = []
-    
     try:
         with open(file_path, "r", encoding="utf-8") as f:
             code = f.read()
-            issues.extend(analyze_async_patterns(code))
     except Exception as e:
-        issues.append(f"Error reading file {file_path}: {e}")
-    
-    return issues
+        return [Finding(str(file_path), 0, 0, "read-error", f"Error reading file: {e}")]
+    return analyze_async_patterns(code, str(file_path), rules)
 
 
-def analyze_project(project_path: Path) -> Dict[Path, List[str]]:
-    """Analyze the entire project for async/sync issues."""
+class ScanStats(NamedTuple):
+    """Counters for one project scan."""
+
+    files: int
+    analyzed: int
+    cached: int
+    prefiltered: int
+    elapsed: float
+
+    @property
+    def files_per_second(self) -> float:
+        return self.files / self.elapsed if self.elapsed > 0 else float(self.files)
+
+
+def _ruleset_signature(rules: List[Rule]) -> str:
+    """Fingerprint the analyzer version and rule set so cached results expire with them."""
+    digest = hashlib.sha256(CACHE_VERSION.encode("utf-8"))
+    for rule in rules:
+        state = sorted(
+            (key, repr(sorted(value) if isinstance(value, (set, frozenset)) else value))
+            for key, value in vars(rule).items()
+        )
+        digest.update(repr((type(rule).__module__, type(rule).__qualname__, state)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+_worker_rules: Optional[List[Rule]] = None
+
+
+def _init_worker(rules: List[Rule]):
+    global _worker_rules
+    _worker_rules = rules
+
+
+def _module_name(rel_path: str) -> Optional[str]:
+    """``app/core/auth.py`` -> ``app.core.auth``; None when the path is not importable."""
+    parts = rel_path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) if parts and all(part.isidentifier() for part in parts) else None
+
+
+def _scan_file(task: Tuple[str, str, Optional[str], bool]) -> Tuple[str, str, Optional[list], Optional[dict], str]:
+    """Analyze one file; returns (rel_path, content hash, findings, summary, outcome).
+
+    Findings are None when the content hash matches the cached one. Files
+    without an 'async def' are not parsed (their summary is None) unless
+    ``helpers`` asks for the summary of their module-level functions.
+    """
+    path, rel_path, cached_hash, helpers = task
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return rel_path, "", [(0, 0, "read-error", f"Error reading file: {e}")], None, "analyzed"
+
+    content_hash = hashlib.sha256(data).hexdigest()
+    if content_hash == cached_hash:
+        return rel_path, content_hash, None, None, "unchanged"
+    # Without an 'async def' there can be no coroutine to report on
+    prefiltered = b"async" not in data or not ASYNC_DEF_BYTES.search(data)
+    if prefiltered and not helpers:
+        return rel_path, content_hash, [], None, "prefiltered"
+
+    try:
+        code = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return rel_path, content_hash, [(0, 0, "read-error", f"Error reading file: {e}")], None, "analyzed"
+    findings, summary = _analyze(code, path, _worker_rules, _module_name(rel_path))
+    outcome = "prefiltered" if prefiltered else "analyzed"
+    return rel_path, content_hash, [(f.line, f.col, f.rule, f.message) for f in findings], summary, outcome
+
+
+def _resolve_project_calls(summaries: Dict[str, dict]) -> Dict[str, List[tuple]]:
+    """Findings, per file, for coroutines that call a blocking helper of another module."""
+    helpers = {}
+    for summary in summaries.values():
+        helpers.update(summary["helpers"])
+    blocking = {name: rule for name, (rule, _) in helpers.items() if rule}
+    changed = True
+    while changed:
+        changed = False
+        for name, (_, callees) in helpers.items():
+            if name in blocking:
+                continue
+            rule = next((blocking[callee] for callee in callees if callee in blocking), None)
+            if rule is not None:
+                blocking[name] = rule
+                changed = True
+
+    findings = {}
+    for rel_path, summary in summaries.items():
+        for line, col, coroutine, target in summary["calls"]:
+            if target in blocking:
+                findings.setdefault(rel_path, []).append((line, col, blocking[target], _helper_message(coroutine, target)))
+    return findings
+
+
+def _referenced_modules(summaries: Iterable[dict]) -> Set[str]:
+    """Modules whose functions the given summaries call."""
+    modules = set()
+    for summary in summaries:
+        targets = [call[3] for call in summary["calls"]]
+        for _, callees in summary["helpers"].values():
+            targets.extend(callees)
+        modules.update(target.rpartition(".")[0] for target in targets)
+    return modules
+
+
+def scan_project(
+    project_path: Path,
+    rules: Optional[List[Rule]] = None,
+    exclude: Iterable[str] = (),
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+) -> Tuple[Dict[Path, List[Finding]], ScanStats]:
+    """Analyze every Python file in the project, in parallel and with a result cache.
+
+    Files whose (size, mtime) match the cache are not read at all; files whose
+    content hash matches are not re-parsed. Small projects are scanned in
+    process, larger ones on a process pool.
+    """
+    started = time.perf_counter()
+    project_path = Path(project_path)
+    rules = RULES if rules is None else rules
+    signature = _ruleset_signature(rules)
+
+    cache_file = get_cache_dir("async_analyzer") / (
+        hashlib.sha256(str(project_path.resolve()).encode("utf-8")).hexdigest()[:24] + ".json"
+    )
+    cached_files = {}
+    if use_cache:
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("signature") == signature:
+                cached_files = cache.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    entries = {}
+    paths = {}
+    tasks = []
+    cached = 0
+    for file_path, rel_path in iter_project_files(project_path, exclude=exclude):
+        try:
+            stat = file_path.stat()
+        except OSError:
+            continue
+        paths[rel_path] = file_path
+        entry = cached_files.get(rel_path)
+        if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            entries[rel_path] = entry
+            cached += 1
+            continue
+        entries[rel_path] = [stat.st_size, stat.st_mtime_ns, None, None, None]
+        tasks.append((str(file_path), rel_path, entry[2] if entry else None, False))
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs > 1 and len(tasks) >= PARALLEL_THRESHOLD:
+        chunksize = max(1, len(tasks) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(rules,)) as pool:
+            results = list(pool.map(_scan_file, tasks, chunksize=chunksize))
+    else:
+        _init_worker(rules)
+        results = [_scan_file(task) for task in tasks]
+
+    outcomes = {"unchanged": 0, "prefiltered": 0, "analyzed": 0}
+    for rel_path, content_hash, findings, summary, outcome in results:
+        if findings is None:
+            findings, summary = cached_files[rel_path][3:5]
+        entries[rel_path][2:] = [content_hash, findings, summary]
+        outcomes[outcome] += 1
+
+    # Files skipped for having no coroutine are parsed after all when a
+    # coroutine elsewhere calls into them, and so on for their own imports
+    modules = {_module_name(rel_path): rel_path for rel_path in entries}
+    summarized = {rel_path: entry[4] for rel_path, entry in entries.items() if entry[4] is not None}
+    pending = list(summarized.values())
+    _init_worker(rules)
+    while pending:
+        needed = [
+            modules[module] for module in _referenced_modules(pending)
+            if module in modules and modules[module] not in summarized
+        ]
+        pending = []
+        for rel_path, content_hash, findings, summary, _ in (
+            _scan_file((str(paths[rel_path]), rel_path, None, True)) for rel_path in needed
+        ):
+            entries[rel_path][2:] = [content_hash, findings, summary]
+            summarized[rel_path] = summary or {"helpers": {}, "calls": []}
+            pending.append(summarized[rel_path])
+    project_findings = _resolve_project_calls(summarized)
+
     issues_by_file = {}
-    
-    for file_path in project_path.rglob("*.py"):
-        issues = analyze_file(file_path)
-        if issues:
-            issues_by_file[file_path] = issues
-    
+    for rel_path, entry in entries.items():
+        findings = entry[3] + project_findings.get(rel_path, [])
+        if findings:
+            file_path = paths[rel_path]
+            findings.sort(key=lambda finding: (finding[0], finding[1]))
+            issues_by_file[file_path] = [Finding(str(file_path), *finding) for finding in findings]
+
+    if use_cache:
+        try:
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump({"signature": signature, "files": entries}, f)
+        except OSError as e:
+            logger.warning("Could not write analyzer cache: %s", e)
+
+    stats = ScanStats(
+        files=len(entries),
+        analyzed=outcomes["analyzed"],
+        cached=cached + outcomes["unchanged"],
+        prefiltered=outcomes["prefiltered"],
+        elapsed=time.perf_counter() - started,
+    )
+    return issues_by_file, stats
+
+
+def analyze_project(
+    project_path: Path,
+    rules: Optional[List[Rule]] = None,
+    exclude: Iterable[str] = (),
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
+) -> Dict[Path, List[Finding]]:
+    """Analyze the entire project for async/sync issues."""
+    issues_by_file, _ = scan_project(project_path, rules, exclude, jobs, use_cache)
     return issues_by_file
 
 
 class AsyncAnalyzer:
     """Analyzes FastAPI projects for async/sync issues and best practices."""
-    
-    def __init__(self):
-        pass
-    
-    def analyze(self, project_path: Path) -> Dict[Path, List[str]]:
+
+    def __init__(self, rules: Optional[List[Rule]] = None, exclude: Iterable[str] = (),
+                 jobs: Optional[int] = None, use_cache: bool = True):
+        self.rules = rules
+        self.exclude = tuple(exclude)
+        self.jobs = jobs
+        self.use_cache = use_cache
+        self.last_stats: Optional[ScanStats] = None
+
+    def analyze(self, project_path: Path) -> Dict[Path, List[Finding]]:
         """Analyze the project for async/sync issues."""
-        return analyze_project(project_path)
-    
+        issues_by_file, self.last_stats = scan_project(
+            project_path, self.rules, self.exclude, self.jobs, self.use_cache
+        )
+        return issues_by_file
+
     def get_analysis_summary(self, project_path: Path) -> str:
         """Get a summary of the async analysis."""
         issues_by_file = self.analyze(project_path)
-        
+
         if not issues_by_file:
             return "No async/sync issues found in the project."
-        
+
         summary_lines = ["Async/Sync Analysis Summary:"]
         for file_path, issues in issues_by_file.items():
             summary_lines.append(f"\n{file_path}:")
             for issue in issues:
-                summary_lines.append(f"  - {issue}")
-        
-        return "\n".join(summary_lines)
\ No newline at end of file
+                summary_lines.append(f"  - line {issue.line}, col {issue.col} [{issue.rule}]: {issue.message}")
+
+        return "\n".join(summary_lines)
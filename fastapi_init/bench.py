@@ -0,0 +1,310 @@
+"""In-process latency benchmarks for a project's routes, with baselines.
+
+Routes come from the static ``ProjectIndex`` (the onboarding report's view
+of the project) and are checked against the imported app's OpenAPI schema.
+GET routes are driven as they are; routes with path parameters or request
+bodies need an example, taken from an examples file or from the examples in
+the OpenAPI schema. Requests go through ``httpx.AsyncClient`` with an
+``ASGITransport``, inside the app's lifespan, so no server or socket is
+involved and only the application's own cost is measured.
+"""
+
+import importlib
+import json
+import math
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from .project_index import ProjectIndex
+
+BENCH_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+PATH_PARAM = re.compile(r"{([^}:]+)(?::[^}]*)?}")
+
+# Latency differences smaller than this are noise, whatever the percentage
+MIN_LATENCY_DELTA_MS = 0.2
+
+
+class BenchTarget(NamedTuple):
+    """One request to benchmark: a route and the example that fills it in."""
+
+    method: str
+    path: str
+    url: str
+    params: Dict[str, Any]
+    body: Any
+    headers: Dict[str, str]
+    form: Optional[Dict[str, Any]] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.method} {self.path}"
+
+
+class RouteStats(NamedTuple):
+    key: str
+    requests: int
+    status: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    requests_per_s: float
+    peak_kib: float  # tracemalloc high-water mark during one request, not bytes allocated in total
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field: value for field, value in self._asdict().items() if field != "key"}
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else float("inf")
+
+    def __str__(self):
+        return f"{self.key}: {self.metric} {self.baseline:.3f} -> {self.current:.3f} ({self.change:+.0%})"
+
+
+def load_app(spec: str = "app.main:app", project_path: Optional[Path] = None):
+    """Import ``module:attribute`` with the project directory on ``sys.path``."""
+    project_path = Path(project_path or Path.cwd()).resolve()
+    if str(project_path) not in sys.path:
+        sys.path.insert(0, str(project_path))
+    module_name, _, attribute = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute or "app")
+
+
+def _schema_example(schema: Dict[str, Any], components: Dict[str, Any], depth: int = 0) -> Any:
+    """An example value for a JSON schema, assembled from its properties' examples."""
+    if depth > 8 or not isinstance(schema, dict):
+        return None
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        return _schema_example(components.get(name, {}), components, depth + 1)
+    if "example" in schema:
+        return schema["example"]
+    if isinstance(schema.get("examples"), list) and schema["examples"]:
+        return schema["examples"][0]
+    if "default" in schema:
+        return schema["default"]
+    for combinator in ("allOf", "anyOf", "oneOf"):
+        for option in schema.get(combinator, []):
+            value = _schema_example(option, components, depth + 1)
+            if value is not None:
+                return value
+    if schema.get("type") == "object" or "properties" in schema:
+        required = set(schema.get("required", ()))
+        value = {}
+        for name, prop in schema.get("properties", {}).items():
+            prop_value = _schema_example(prop, components, depth + 1)
+            if prop_value is not None:
+                value[name] = prop_value
+            elif name in required:
+                return None
+        return value
+    return None
+
+
+def _openapi_example(item: Dict[str, Any], components: Dict[str, Any]) -> Any:
+    """The first example declared on an OpenAPI parameter or media type, or its schema's."""
+    if "example" in item:
+        return item["example"]
+    examples = item.get("examples")
+    if isinstance(examples, dict) and examples:
+        first = next(iter(examples.values()))
+        return first.get("value") if isinstance(first, dict) else first
+    return _schema_example(item.get("schema", {}), components)
+
+
+def _operation_example(operation: Dict[str, Any], components: Dict[str, Any]) -> Dict[str, Any]:
+    """Path/query parameters and a body built from an operation's examples."""
+    example: Dict[str, Any] = {"path": {}, "params": {}}
+    for parameter in operation.get("parameters", []):
+        value = _openapi_example(parameter, components)
+        if value is not None and parameter.get("in") in ("path", "query"):
+            example["path" if parameter["in"] == "path" else "params"][parameter["name"]] = value
+    content = operation.get("requestBody", {}).get("content", {})
+    for media_type, field in (("application/json", "json"), ("application/x-www-form-urlencoded", "data")):
+        body = _openapi_example(content[media_type], components) if media_type in content else None
+        if body is not None:
+            example[field] = body
+    return example
+
+
+def discover_targets(
+    project_path: Path,
+    app,
+    examples: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Tuple[List[BenchTarget], List[str]]:
+    """Routes to benchmark, and the routes skipped with the reason why.
+
+    ``examples`` maps ``"METHOD /path/{param}"`` to ``{"path": {...},
+    "params": {...}, "json": ..., "data": {...}, "headers": {...}}``
+    (``data`` is a form body); entries override the examples found in the
+    OpenAPI schema.
+    """
+    examples = examples or {}
+    schema = app.openapi()
+    openapi_paths = schema.get("paths", {})
+    components = schema.get("components", {}).get("schemas", {})
+    targets: List[BenchTarget] = []
+    skipped: List[str] = []
+    seen = set()
+    for route in ProjectIndex.build(project_path).routes:
+        key = f"{route.method} {route.path}"
+        if route.method not in BENCH_METHODS or key in seen:
+            continue
+        seen.add(key)
+        operation = openapi_paths.get(route.path, {}).get(route.method.lower())
+        if operation is None:
+            skipped.append(f"{key}: not served by the app")
+            continue
+
+        example = _operation_example(operation, components)
+        for field, value in examples.get(key, {}).items():
+            if isinstance(value, dict) and isinstance(example.get(field), dict):
+                example[field] = {**example[field], **value}
+            else:
+                example[field] = value
+
+        missing = [name for name in PATH_PARAM.findall(route.path) if name not in example["path"]]
+        if missing:
+            skipped.append(f"{key}: no example for {', '.join(missing)}")
+            continue
+        if route.method != "GET" and "json" not in example and "data" not in example and "requestBody" in operation:
+            skipped.append(f"{key}: no example body")
+            continue
+
+        url = PATH_PARAM.sub(lambda match: str(example["path"][match.group(1)]), route.path)
+        targets.append(BenchTarget(
+            route.method, route.path, url, example.get("params", {}), example.get("json"), example.get("headers", {}),
+            example.get("data"),
+        ))
+    skipped.extend(f"{key}: example matches no route" for key in examples if key not in seen)
+    return targets, skipped
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+@asynccontextmanager
+async def _lifespan(app):
+    context = getattr(getattr(app, "router", None), "lifespan_context", None)
+    if context is None:
+        yield
+        return
+    async with context(app):
+        yield
+
+
+async def _request(client, target: BenchTarget):
+    kwargs: Dict[str, Any] = {"params": target.params, "headers": target.headers}
+    if target.body is not None:
+        kwargs["json"] = target.body
+    if target.form is not None:
+        kwargs["data"] = target.form
+    return await client.request(target.method, target.url, **kwargs)
+
+
+async def bench_target(client, target: BenchTarget, requests: int = 200, warmup: int = 20) -> RouteStats:
+    """Time ``requests`` sequential requests, then measure peak memory separately."""
+    status = 0
+    for _ in range(warmup):
+        status = (await _request(client, target)).status_code
+
+    timings = []
+    start = time.perf_counter()
+    for _ in range(requests):
+        began = time.perf_counter()
+        status = (await _request(client, target)).status_code
+        timings.append((time.perf_counter() - began) * 1000)
+    elapsed = time.perf_counter() - start
+
+    # A separate pass: tracemalloc slows allocation down a lot
+    samples = min(requests, 20)
+    peak_total = 0
+    for _ in range(samples):
+        tracemalloc.start()
+        try:
+            await _request(client, target)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_total += peak
+
+    timings.sort()
+    return RouteStats(
+        key=target.key,
+        requests=requests,
+        status=status,
+        p50_ms=percentile(timings, 50),
+        p95_ms=percentile(timings, 95),
+        p99_ms=percentile(timings, 99),
+        requests_per_s=requests / elapsed if elapsed else 0.0,
+        peak_kib=peak_total / samples / 1024 if samples else 0.0,
+    )
+
+
+async def run_benchmarks(app, targets: List[BenchTarget], requests: int = 200, warmup: int = 20) -> List[RouteStats]:
+    """Benchmark every target in one client, inside the app's lifespan."""
+    import httpx
+
+    results = []
+    async with _lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for target in targets:
+                results.append(await bench_target(client, target, requests, warmup))
+    return results
+
+
+def read_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["routes"]
+
+
+def write_baseline(path: Path, results: List[RouteStats]) -> None:
+    data = {
+        "python": sys.version.split()[0],
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "routes": {result.key: result.as_dict() for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(
+    results: List[RouteStats],
+    baseline: Dict[str, Dict[str, Any]],
+    metric: str = "p95_ms",
+    max_regression: float = 0.20,
+    max_peak_regression: float = 0.25,
+) -> List[Regression]:
+    """Routes whose latency ``metric`` or peak memory grew past the allowed ratio."""
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None:
+            continue
+        current = getattr(result, metric)
+        before = previous.get(metric, 0.0)
+        if current > before * (1 + max_regression) and current - before > MIN_LATENCY_DELTA_MS:
+            regressions.append(Regression(result.key, metric, before, current))
+        before_peak = previous.get("peak_kib", 0.0)
+        if before_peak and result.peak_kib > before_peak * (1 + max_peak_regression):
+            regressions.append(Regression(result.key, "peak_kib", before_peak, result.peak_kib))
+    return regressions
@@ -0,0 +1 @@
+"""Click commands, imported lazily by ``fastapi_init.cli``."""
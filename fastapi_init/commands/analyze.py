@@ -0,0 +1,21 @@
+"""Async/sync analysis command."""
+
+import click
+from pathlib import Path
+from fastapi_init.async_analyzer import AsyncAnalyzer
+
+@click.command()
+@click.argument('project_path', type=click.Path(exists=True, file_okay=False, path_type=Path), default='.')
+@click.option('--exclude', multiple=True, help='Extra glob to skip (repeatable); .gitignore is always honoured')
+@click.option('--jobs', type=int, default=None, help='Worker processes (default: CPU count)')
+@click.option('--no-cache', is_flag=True, help='Ignore and do not update the on-disk result cache')
+def analyze(project_path, exclude, jobs, no_cache):
+    """Find blocking calls made inside async functions."""
+    analyzer = AsyncAnalyzer(exclude=exclude, jobs=jobs, use_cache=not no_cache)
+    click.echo(analyzer.get_analysis_summary(project_path))
+    stats = analyzer.last_stats
+    click.echo(
+        f"\nScanned {stats.files} files in {stats.elapsed:.2f}s "
+        f"({stats.files_per_second:.0f} files/s; {stats.analyzed} analyzed, "
+        f"{stats.cached} from cache, {stats.prefiltered} without async code)"
+    )
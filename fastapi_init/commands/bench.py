@@ -0,0 +1,68 @@
+"""Route benchmark command."""
+
+import asyncio
+import json
+import click
+from pathlib import Path
+from fastapi_init.bench import compare, discover_targets, load_app, read_baseline, run_benchmarks, write_baseline
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+@click.command()
+@click.option('--app', 'app_spec', default='app.main:app', show_default=True, help='The app to import, as module:attribute')
+@click.option('--requests', type=click.IntRange(1), default=200, show_default=True, help='Timed requests per route')
+@click.option('--warmup', type=click.IntRange(0), default=20, show_default=True, help='Untimed requests per route first')
+@click.option('--examples', type=click.Path(exists=True, dir_okay=False, path_type=Path),
+              help='JSON file of path parameters, query parameters and bodies keyed by "METHOD /path"')
+@click.option('--route', 'route_filters', multiple=True, help='Only routes whose "METHOD /path" contains this text')
+@click.option('--baseline', type=click.Path(dir_okay=False, path_type=Path), default='bench_baseline.json',
+              show_default=True, help='Baseline file; written on the first run, compared against afterwards')
+@click.option('--update-baseline', is_flag=True, help='Overwrite the baseline with this run')
+@click.option('--metric', type=click.Choice(METRICS), default='p95_ms', show_default=True,
+              help='Latency percentile checked against the baseline')
+@click.option('--max-regression', type=float, default=20.0, show_default=True,
+              help='Allowed latency increase over the baseline, in percent')
+@click.option('--max-peak-regression', type=float, default=25.0, show_default=True,
+              help='Allowed increase of the per-request peak memory over the baseline, in percent')
+def bench(app_spec, requests, warmup, examples, route_filters, baseline, update_baseline, metric,
+          max_regression, max_peak_regression):
+    """Benchmark every route in-process and check for regressions."""
+    project_path = Path.cwd()
+    try:
+        app = load_app(app_spec, project_path)
+    except (ImportError, AttributeError) as e:
+        raise click.ClickException(f"Could not import {app_spec}: {e}")
+
+    example_data = {}
+    if examples is not None:
+        with open(examples, encoding="utf-8") as f:
+            example_data = json.load(f)
+    targets, skipped = discover_targets(project_path, app, example_data)
+    if route_filters:
+        targets = [target for target in targets if any(text in target.key for text in route_filters)]
+    if not targets:
+        raise click.ClickException("No routes to benchmark.")
+
+    click.echo(f"Benchmarking {len(targets)} routes, {requests} requests each...")
+    results = asyncio.run(run_benchmarks(app, targets, requests, warmup))
+
+    click.echo(f"{'route':<44} {'status':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>9} {'peak KiB':>8}")
+    for result in results:
+        click.echo(f"{result.key:<44} {result.status:>6} {result.p50_ms:8.3f} {result.p95_ms:8.3f} "
+                   f"{result.p99_ms:8.3f} {result.requests_per_s:9.0f} {result.peak_kib:8.1f}")
+    for reason in skipped:
+        click.echo(f"  skipped {reason}")
+    failed = [result.key for result in results if result.status >= 400]
+    if failed:
+        click.echo(f"Warning: {len(failed)} routes answered with an error status; their numbers measure the error path.")
+
+    if update_baseline or not baseline.exists():
+        write_baseline(baseline, results)
+        click.echo(f"Baseline written to {baseline}")
+        return
+    regressions = compare(results, read_baseline(baseline), metric, max_regression / 100, max_peak_regression / 100)
+    if regressions:
+        for regression in regressions:
+            click.echo(f"  regression {regression}")
+        raise click.ClickException(f"{len(regressions)} regressions against {baseline}")
+    click.echo(f"No regressions against {baseline}.")
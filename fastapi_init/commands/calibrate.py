@@ -0,0 +1,29 @@
+"""Password hashing calibration command."""
+
+import click
+from pathlib import Path
+from fastapi_init.hash_calibrator import CALIBRATORS
+from fastapi_init.utils import update_env_file
+
+@click.command()
+@click.option('--target-ms', type=float, default=250.0, show_default=True, help='Target time for one password hash')
+@click.option('--scheme', type=click.Choice(sorted(CALIBRATORS)), default='bcrypt', show_default=True)
+@click.option('--env-file', type=click.Path(dir_okay=False, path_type=Path), default='.env', show_default=True,
+              help='Dotenv file to update with the chosen settings')
+@click.option('--dry-run', is_flag=True, help='Print the settings without writing them')
+def auto_calibrate(target_ms, scheme, env_file, dry_run):
+    """Pick the password hashing cost for a target latency on this CPU."""
+    click.echo(f"Calibrating {scheme} for ~{target_ms:.0f} ms per hash...")
+    try:
+        result = CALIBRATORS[scheme](target_ms)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+    values = result.env_values()
+    for key, value in values.items():
+        click.echo(f"  {key}={value}")
+    click.echo(f"One hash takes {result.hash_ms:.0f} ms with these settings.")
+    if dry_run:
+        return
+    update_env_file(env_file, values)
+    click.echo(f"Updated {env_file}. Existing hashes are upgraded on each user's next login.")
@@ -0,0 +1,16 @@
+"""Environment checking command."""
+
+import click
+from fastapi_init.env_checker import EnvironmentChecker
+
+@click.command()
+def env_check():
+    """Check the environment for missing dependencies and issues."""
+    checker = EnvironmentChecker()
+    issues = checker.check_environment()
+    if issues:
+        click.echo("Issues found in the environment:")
+        for issue in issues:
+            click.echo(f"- {issue}")
+    else:
+        click.echo("No issues found in the environment.")
@@ -0,0 +1,28 @@
+"""Code generation commands."""
+
+import click
+from pathlib import Path
+from fastapi_init.resource_generator import FIELD_TYPES, ResourceError, generate_resource
+
+@click.group()
+def generate():
+    """Generate code in an existing project."""
+
+@generate.command()
+@click.argument('name')
+@click.option('--field', 'fields', multiple=True, metavar='NAME:TYPE[:index][:optional]',
+              help=f"A column (repeatable); TYPE is one of {', '.join(FIELD_TYPES)}. Default: name:str:index")
+@click.option('--belongs-to', metavar='MODEL', help='Add a foreign key to MODEL, loaded with selectinload in detail views')
+@click.option('--bulk', is_flag=True, help='Add streaming NDJSON POST /bulk and GET /export endpoints and a benchmark')
+@click.option('--force', is_flag=True, help='Overwrite files the resource already has')
+def resource(name, fields, belongs_to, bulk, force):
+    """Generate a model, schemas, service and router with keyset pagination."""
+    project_path = Path.cwd()
+    try:
+        written = generate_resource(project_path, name, list(fields), belongs_to=belongs_to, force=force, bulk=bulk)
+    except ResourceError as e:
+        raise click.ClickException(str(e))
+    for path in written:
+        click.echo(f"  wrote {path.relative_to(project_path)}")
+    click.echo("Router included in app/api/v1/router.py.")
+    click.echo("Create the table with: alembic revision --autogenerate -m 'add " + name + "' && alembic upgrade head")
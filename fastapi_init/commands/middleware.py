@@ -0,0 +1,109 @@
+"""Commands that add middleware to an existing project."""
+
+import click
+from pathlib import Path
+from fastapi_init.templates import render_template
+
+@click.command()
+def add_error_middleware():
+    """Add customizable error handling middleware to the FastAPI app."""
+    from fastapi_init.error_middleware import ErrorMiddleware
+
+    middleware = ErrorMiddleware()
+    project_path = Path.cwd()
+    success = middleware.add_to_project(project_path)
+    if success:
+        click.echo("Error middleware added.")
+    else:
+        click.echo("Failed to add error middleware.")
+
+@click.command()
+def add_monitoring():
+    """Add Prometheus metrics middleware and a /metrics endpoint."""
+    project_path = Path.cwd()
+    _write_files(project_path, {"app/core/monitoring.py": "monitoring.py"})
+    _add_requirement(project_path, "prometheus-client>=0.17.0")
+    
+    click.echo("Monitoring configuration added.")
+    click.echo("Import and use setup_monitoring() in your main.py; metrics are served at /metrics")
+    click.echo("With several workers, set PROMETHEUS_MULTIPROC_DIR to an empty directory before starting the server.")
+
+@click.command()
+def add_rate_limiting():
+    """Add rate limiting middleware."""
+    project_path = Path.cwd()
+    _write_files(project_path, {
+        "app/core/rate_limit.py": "rate_limit.py",
+        "scripts/bench_rate_limit.py": "bench_rate_limit.py",
+    })
+    
+    click.echo("Rate limiting middleware added.")
+    click.echo("Import and use setup_rate_limiting() in your main.py")
+    click.echo("Set RATE_LIMIT_STORAGE=sqlite to share limits across workers.")
+    click.echo("Benchmark it with: python scripts/bench_rate_limit.py")
+
+@click.command()
+def add_caching():
+    """Add a response cache with ETags, per-route TTLs and hit counters."""
+    project_path = Path.cwd()
+    _write_files(project_path, {
+        "app/core/cache.py": "cache.py",
+        "scripts/bench_cache.py": "bench_cache.py",
+    })
+    
+    click.echo("Response cache added.")
+    click.echo("Import and use setup_caching() in your main.py, then mark routes with @cache_response(ttl=60)")
+    click.echo("or list path prefixes in CACHE_ROUTES. Hit ratios are served at /cache/stats.")
+    click.echo("Set CACHE_BACKEND=sqlite to share entries across workers and keep them across restarts.")
+    click.echo("Benchmark it with: python scripts/bench_cache.py")
+
+@click.command()
+def add_compression():
+    """Add gzip, brotli and zstd response compression."""
+    project_path = Path.cwd()
+    _write_files(project_path, {
+        "app/core/compression.py": "compression.py",
+        "scripts/bench_compression.py": "bench_compression.py",
+    })
+    
+    click.echo("Compression middleware added.")
+    click.echo("Import and use setup_compression() in your main.py, after any other setup_* call.")
+    click.echo("gzip works as is; pip install brotli zstandard to offer br and zstd as well.")
+    click.echo("Compare levels with: python scripts/bench_compression.py")
+
+@click.command()
+def add_profiling():
+    """Add a sampling profiler that writes flamegraph stacks per route."""
+    project_path = Path.cwd()
+    _write_files(project_path, {
+        "app/core/profiling.py": "profiling.py",
+        "scripts/bench_profiling.py": "bench_profiling.py",
+    })
+    
+    click.echo("Request profiler added.")
+    click.echo("Import and use setup_profiling() in your main.py, then set PROFILING_SAMPLE_RATE (e.g. 0.01)")
+    click.echo("or send a header from: python -c \"from app.core.profiling import profile_token; print('X-Profile:', profile_token())\"")
+    click.echo("Collapsed stacks per route are written to logs/profiles/, ready for flamegraph.pl or speedscope.")
+    click.echo("Measure its overhead with: python scripts/bench_profiling.py")
+
+def _write_files(project_path: Path, files: dict):
+    """Render each template into the project at its relative path, creating directories."""
+    for relative_path, template in files.items():
+        path = project_path / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_template(template))
+
+def _add_requirement(project_path: Path, requirement: str):
+    """Append a requirement to the project's requirements.txt unless it is listed."""
+    requirements_file = project_path / "requirements.txt"
+    if not requirements_file.exists():
+        return
+    name = requirement.split(">=")[0].split("==")[0].lower()
+    content = requirements_file.read_text(encoding="utf-8")
+    for line in content.splitlines():
+        if line.strip().lower().replace("_", "-").startswith(name):
+            return
+    if content and not content.endswith("\n"):
+        content += "\n"
+    requirements_file.write_text(content + requirement + "\n", encoding="utf-8")
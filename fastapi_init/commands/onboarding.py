@@ -0,0 +1,13 @@
+"""Onboarding report command."""
+
+import click
+from pathlib import Path
+from fastapi_init.onboarding import OnboardingReport
+
+@click.command()
+def onboarding_report():
+    """Generate an onboarding report for the FastAPI project."""
+    report = OnboardingReport()
+    project_path = Path.cwd()
+    report_path = report.generate(project_path)
+    click.echo(f"Onboarding report generated at: {report_path}")
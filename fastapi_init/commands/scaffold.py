@@ -0,0 +1,98 @@
+"""Project scaffolding commands."""
+
+import click
+from pathlib import Path
+from fastapi_init.scaffolder import DATABASE_MODES, SERVER_PROFILES, ProjectScaffolder
+from fastapi_init.templates import render_template
+
+@click.command()
+@click.argument('project_name')
+@click.option('--with-database', type=click.Choice(DATABASE_MODES), is_flag=False, flag_value='sync',
+              help='Include database setup with SQLAlchemy and Alembic (sync or async; default sync)')
+@click.option('--with-auth', is_flag=True, help='Include JWT authentication system')
+@click.option('--with-docker', is_flag=True, help='Include Docker and Docker Compose files')
+@click.option('--with-tests', is_flag=True, help='Include comprehensive test setup')
+@click.option('--fast-json', is_flag=True, help='Serialize responses with orjson and prebuilt Pydantic TypeAdapters')
+@click.option('--server-profile', type=click.Choice(SERVER_PROFILES), is_flag=False, flag_value='gunicorn',
+              help='Run production with one worker per container CPU (gunicorn or uvicorn; default gunicorn)')
+def init(project_name, with_database, with_auth, with_docker, with_tests, fast_json, server_profile):
+    """Initialize a new FastAPI project scaffold."""
+    scaffolder = ProjectScaffolder()
+    project_path = scaffolder.create_project_scaffold(project_name, database_mode=with_database or "sync",
+                                                      fast_json=fast_json, server_profile=server_profile)
+    click.echo(f"Project created at: {project_path}")
+    
+    if with_database or with_auth or with_docker or with_tests or fast_json or server_profile:
+        click.echo("Enhanced features included:")
+        if with_database:
+            click.echo(f"  - Database setup with SQLAlchemy ({with_database}) and Alembic")
+        if with_auth:
+            click.echo("  - JWT authentication system")
+        if with_docker:
+            click.echo("  - Docker and Docker Compose configuration")
+        if with_tests:
+            click.echo("  - Comprehensive test setup")
+        if fast_json:
+            click.echo("  - orjson responses; benchmark with: python scripts/bench_json.py")
+        if server_profile:
+            click.echo(f"  - Production server profile ({server_profile}); run with: make run-prod")
+
+@click.command()
+def setup_database():
+    """Set up database with Alembic migrations."""
+    project_path = Path.cwd()
+    alembic_dir = project_path / "alembic"
+    
+    if not alembic_dir.exists():
+        click.echo("Alembic not found. Please run 'fastapi-init init' with --with-database first.")
+        return
+    
+    try:
+        import subprocess
+        import sys
+        
+        # Initialize Alembic
+        result = subprocess.run([sys.executable, "-m", "alembic", "init", "alembic"], 
+                              cwd=project_path, capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            click.echo("Database setup completed successfully.")
+            click.echo("Run 'alembic upgrade head' to apply migrations.")
+        else:
+            click.echo(f"Failed to setup database: {result.stderr}")
+            
+    except ImportError:
+        click.echo("Alembic not installed. Install it with: pip install alembic")
+    except Exception as e:
+        click.echo(f"Error setting up database: {e}")
+
+@click.command()
+def docker_setup():
+    """Set up Docker configuration for the project."""
+    project_path = Path.cwd()
+    
+    # Check if Dockerfile already exists
+    dockerfile_path = project_path / "Dockerfile"
+    if dockerfile_path.exists():
+        click.echo("Dockerfile already exists.")
+        return
+    
+    # The same Dockerfile init writes, running the project's server profile
+    if (project_path / "gunicorn.conf.py").exists():
+        server_profile = "gunicorn"
+    elif (project_path / "app" / "core" / "server.py").exists():
+        server_profile = "uvicorn"
+    else:
+        server_profile = None
+    context = {"project_name": project_path.name, "server_profile": server_profile}
+    try:
+        for name in ("Dockerfile", "docker-compose.yml"):
+            with open(project_path / name, "w", encoding="utf-8") as f:
+                f.write(render_template(name, **context))
+        
+        click.echo("Docker configuration created successfully.")
+        click.echo("Run 'docker build -t app .' to build the image.")
+        click.echo("Run 'docker-compose up' to start the services.")
+        
+    except Exception as e:
+        click.echo(f"Error setting up Docker: {e}")
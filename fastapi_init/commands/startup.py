@@ -0,0 +1,43 @@
+"""Startup profiling command."""
+
+import json
+import click
+from pathlib import Path
+from fastapi_init.startup_profiler import PHASES, group_imports, measure_startup, to_dict
+
+@click.command()
+@click.option('--app', 'app_spec', default='app.main:app', show_default=True, help='The app to import, as module:attribute')
+@click.option('--path', help='GET path for the first request. Default: the first GET route without path parameters')
+@click.option('--runs', type=click.IntRange(1), default=3, show_default=True, help='Cold starts; the median is reported')
+@click.option('--top', type=click.IntRange(1), default=15, show_default=True, help='Import groups and lifespan lines to list')
+@click.option('--json', 'as_json', is_flag=True, help='Print the profile as JSON, for CI to track cold starts over time')
+def profile_startup(app_spec, path, runs, top, as_json):
+    """Time imports, lifespan startup, OpenAPI generation and the first request."""
+    project_path = Path.cwd()
+    try:
+        profile = measure_startup(project_path, app_spec, path, runs)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+
+    if as_json:
+        click.echo(json.dumps(to_dict(profile, project_path, app_spec, runs, top), indent=2))
+        return
+
+    imports = profile.import_ms_by_phase()
+    click.echo(f"Cold start of {app_spec}, median of {runs} run{'s' if runs > 1 else ''}:")
+    click.echo(f"  {'phase':<16} {'ms':>9} {'share':>7} {'imports ms':>11}")
+    for name in sorted(PHASES, key=lambda phase: profile.phases[phase], reverse=True):
+        share = profile.phases[name] / profile.total_ms if profile.total_ms else 0.0
+        click.echo(f"  {name:<16} {profile.phases[name]:9.1f} {share:7.1%} {imports.get(name, 0.0):11.1f}")
+    click.echo(f"  ready (import + lifespan) {profile.ready_ms:.1f} ms; first response "
+               f"(GET {profile.path} -> {profile.status}) after {profile.total_ms:.1f} ms")
+    click.echo(f"  a second request takes {profile.phases['second_request']:.1f} ms")
+
+    if profile.lifespan_lines:
+        click.echo("Lifespan startup, by line:")
+        for line in [line for line in profile.lifespan_lines if line.ms >= 0.05][:top]:
+            click.echo(f"  {line.ms:9.1f} ms  {line.location:<24} {line.source}")
+
+    click.echo("Imports, by self time:")
+    for group in group_imports(profile.imports, project_path)[:top]:
+        click.echo(f"  {group.self_ms:9.1f} ms  {group.name:<32} {group.modules:>4} module{'s' if group.modules > 1 else ''}")
@@ -0,0 +1,16 @@
+"""Test setup command."""
+
+import click
+from pathlib import Path
+from fastapi_init.test_booster import TestBooster
+
+@click.command()
+def test_init():
+    """Set up async test support and example test suite."""
+    booster = TestBooster()
+    project_path = Path.cwd()
+    success = booster.setup_tests(project_path)
+    if success:
+        click.echo("Async test support and example tests set up.")
+    else:
+        click.echo("Failed to set up tests.")
@@ -2,9 +2,8 @@
 
 from pathlib import Path
 from typing import Dict, Any
-from jinja2 import Environment, DictLoader
 
-from .templates import TEMPLATES
+from .templates import get_template_env
 from .utils import logger
 from .scaffolder import ProjectScaffolder
 from .env_checker import EnvironmentChecker
@@ -18,7 +17,7 @@ class FastAPIKickstart:
     """Main class for the FastAPI Kickstart toolkit."""
 
     def __init__(self):
-        self.template_env = Environment(loader=DictLoader(TEMPLATES))
+        self.template_env = get_template_env()
         self.scaffolder = ProjectScaffolder()
         self.env_checker = EnvironmentChecker()
         self.async_analyzer = AsyncAnalyzer()
@@ -0,0 +1,225 @@
+"""In-process dependency resolution for the environment checker.
+
+Installed distributions are discovered with a single scan of the ``*.dist-info``
+and ``*.egg-info`` directories on ``sys.path``; metadata files are only read
+when a requirement asks for extras or a directory name carries no version.
+The same scan yields an environment fingerprint that keys an on-disk result
+cache, so repeated checks against an unchanged environment skip resolution.
+The cache only ever holds results for the current fingerprint, and at most
+``MAX_CACHED_RESULTS`` requirement sets, dropping the oldest first.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from .utils import get_cache_dir, logger
+
+METADATA_SUFFIXES = (".dist-info", ".egg-info")
+CACHE_FILE = "env_check.json"
+MAX_CACHED_RESULTS = 32
+
+
+def read_requirements_file(requirements_file: Path) -> List[str]:
+    """Read requirement strings from a requirements.txt file.
+
+    Comments, blank lines and pip options (``-r``, ``-e``, ``--index-url`` ...)
+    are skipped.
+    """
+    requirements = []
+    with open(requirements_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split(" #", 1)[0].strip()
+            if not line or line.startswith("#") or line.startswith("-"):
+                continue
+            requirements.append(line)
+    return requirements
+
+
+def read_pyproject_dependencies(pyproject_file: Path) -> List[str]:
+    """Read ``[project] dependencies`` from a pyproject.toml file."""
+    if tomllib is None:
+        logger.warning("tomli is not installed; skipping %s", pyproject_file)
+        return []
+    try:
+        with open(pyproject_file, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        logger.warning("Could not parse %s: %s", pyproject_file, e)
+        return []
+    dependencies = data.get("project", {}).get("dependencies", [])
+    return [dep for dep in dependencies if isinstance(dep, str)]
+
+
+def _split_metadata_dir(dir_name: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split ``name-version.dist-info`` into its name and version parts."""
+    for suffix in METADATA_SUFFIXES:
+        if dir_name.endswith(suffix):
+            parts = dir_name[: -len(suffix)].split("-")
+            if len(parts) >= 2:
+                return parts[0], parts[1]
+    return None, None
+
+
+class DependencyResolver:
+    """Checks requirement strings against the installed distributions in one pass."""
+
+    def __init__(self, paths: Optional[List[str]] = None, use_cache: bool = True):
+        self.paths = list(sys.path if paths is None else paths)
+        self.use_cache = use_cache
+        self._index: Optional[Dict[str, Tuple[str, str]]] = None
+        self._fingerprint: Optional[str] = None
+        self._requires: Dict[str, List[Requirement]] = {}
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the interpreter and every installed metadata directory's mtime."""
+        self._scan()
+        return self._fingerprint
+
+    def installed(self) -> Dict[str, str]:
+        """Return a mapping of canonical distribution name to installed version."""
+        self._scan()
+        return {name: version for name, (version, _) in self._index.items()}
+
+    def is_satisfied(self, requirement: str) -> bool:
+        """Check a single PEP 508 requirement string against the environment."""
+        self._scan()
+        try:
+            req = Requirement(requirement)
+        except InvalidRequirement:
+            logger.warning("Unparseable requirement: %s", requirement)
+            return False
+        return self._check(req, "", set())
+
+    def missing(self, requirements: Iterable[str]) -> List[str]:
+        """Return the requirements that are not satisfied, preserving their order."""
+        requirements = list(dict.fromkeys(requirements))
+        self._scan()
+
+        cache_key = hashlib.sha256("\n".join(requirements).encode("utf-8")).hexdigest()
+        cache = self._load_cache() if self.use_cache else {}
+        results = cache.get("results", {}) if cache.get("fingerprint") == self._fingerprint else {}
+        if cache_key in results:
+            return results[cache_key]
+
+        missing = [req for req in requirements if not self.is_satisfied(req)]
+
+        if self.use_cache:
+            results[cache_key] = missing
+            for stale_key in list(results)[:-MAX_CACHED_RESULTS]:
+                del results[stale_key]
+            self._store_cache({"fingerprint": self._fingerprint, "results": results})
+        return missing
+
+    def _scan(self):
+        """Index installed distributions and fingerprint the environment."""
+        if self._index is not None:
+            return
+
+        index = {}
+        digest = hashlib.sha256(sys.executable.encode("utf-8"))
+        for entry in self.paths:
+            if not entry or not os.path.isdir(entry):
+                continue
+            try:
+                items = sorted(os.scandir(entry), key=lambda item: item.name)
+            except OSError:
+                continue
+            digest.update(entry.encode("utf-8"))
+            for item in items:
+                if not item.name.endswith(METADATA_SUFFIXES):
+                    continue
+                try:
+                    mtime = item.stat().st_mtime_ns
+                except OSError:
+                    continue
+                digest.update(f"{item.name}:{mtime}\n".encode("utf-8"))
+
+                name, version = _split_metadata_dir(item.name)
+                if name is None:
+                    dist = metadata.PathDistribution(Path(item.path))
+                    name, version = dist.metadata["Name"], dist.version
+                    if not name:
+                        continue
+                # The first entry on sys.path shadows later ones, as with imports
+                index.setdefault(canonicalize_name(name), (version, item.path))
+
+        self._index = index
+        self._fingerprint = digest.hexdigest()
+
+    def _check(self, req: Requirement, extra: str, seen: Set[str]) -> bool:
+        if req.marker is not None and not req.marker.evaluate({"extra": extra}):
+            return True
+
+        name = canonicalize_name(req.name)
+        if name in seen:
+            return True
+        installed = self._index.get(name)
+        if installed is None:
+            return False
+
+        version, path = installed
+        if req.specifier:
+            try:
+                if not req.specifier.contains(version, prereleases=True):
+                    return False
+            except InvalidVersion:
+                return False
+
+        if req.extras:
+            seen = seen | {name}
+            for dependency in self._requires_for(path):
+                if dependency.marker is None or dependency.marker.evaluate({"extra": ""}):
+                    continue
+                for requested_extra in req.extras:
+                    if not dependency.marker.evaluate({"extra": canonicalize_name(requested_extra)}):
+                        continue
+                    if not self._check(dependency, canonicalize_name(requested_extra), seen):
+                        return False
+        return True
+
+    def _requires_for(self, path: str) -> List[Requirement]:
+        """Parse (once) the ``Requires-Dist`` entries of an installed distribution."""
+        if path not in self._requires:
+            requires = []
+            for line in metadata.PathDistribution(Path(path)).requires or []:
+                try:
+                    requires.append(Requirement(line))
+                except InvalidRequirement:
+                    continue
+            self._requires[path] = requires
+        return self._requires[path]
+
+    def _cache_file(self) -> Path:
+        return get_cache_dir() / CACHE_FILE
+
+    def _load_cache(self) -> dict:
+        try:
+            with open(self._cache_file(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _store_cache(self, data: dict):
+        try:
+            with open(self._cache_file(), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError as e:
+            logger.warning("Could not write environment cache: %s", e)
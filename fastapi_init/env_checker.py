@@ -1,14 +1,14 @@
-import os
-import sys
-import subprocess
+import shlex
 from pathlib import Path
 from typing import List
 
+from .dependency_resolver import DependencyResolver, read_pyproject_dependencies, read_requirements_file
+
 class EnvironmentChecker:
     """Class to check the Python environment for missing dependencies and configuration issues."""
 
-    def __init__(self):
-        pass
+    def __init__(self, resolver: DependencyResolver = None):
+        self.resolver = resolver or DependencyResolver()
 
     def check_environment(self, project_path: Path = None) -> List[str]:
         """Check for missing dependencies and return a list of issues."""
@@ -33,20 +33,16 @@ class EnvironmentChecker:
         requirements_file = project_path / "requirements.txt"
         pyproject_file = project_path / "pyproject.toml"
 
-        missing_dependencies = []
+        required_packages = []
 
         if requirements_file.exists():
-            with open(requirements_file, "r") as f:
-                required_packages = [line.strip() for line in f if line.strip() and not line.startswith("#")]
-                for package in required_packages:
-                    if not self._is_package_installed(package):
-                        missing_dependencies.append(package)
+            required_packages.extend(read_requirements_file(requirements_file))
 
         if pyproject_file.exists():
-            # Here you could add logic to check for dependencies in pyproject.toml
-            pass
+            required_packages.extend(read_pyproject_dependencies(pyproject_file))
 
-        return missing_dependencies
+        # Resolve everything in a single pass over the installed distributions
+        return self.resolver.missing(required_packages)
 
     def check_configuration(self, project_path: Path) -> List[str]:
         """Check for common configuration issues."""
@@ -65,12 +61,8 @@ class EnvironmentChecker:
         return issues
 
     def _is_package_installed(self, package: str) -> bool:
-        """Check if a package is installed in the current environment."""
-        try:
-            subprocess.run([sys.executable, "-m", "pip", "show", package], check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        """Check if a requirement is satisfied by the current environment."""
+        return self.resolver.is_satisfied(package)
 
     def report_missing_dependencies(self, project_path: Path = None):
         """Report any missing dependencies to the user."""
@@ -83,6 +75,6 @@ class EnvironmentChecker:
             for package in missing:
                 print(f"- {package}")
             print("\nYou can install them using pip:")
-            print(f"pip install {' '.join(missing)}")
+            print(f"pip install {' '.join(shlex.quote(package) for package in missing)}")
         else:
             print("All dependencies are satisfied.")
\ No newline at end of file
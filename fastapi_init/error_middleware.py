@@ -1,44 +1,14 @@
-from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
-from pathlib import Path
 import logging
+from pathlib import Path
 
-logger = logging.getLogger(__name__)
-
-class ErrorMiddleware:
-    def __init__(self, app=None):
-        self.app = app
+from fastapi_init.templates import middleware, render_template
 
-    async def __call__(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            if response.status_code >= 400:
-                return self.handle_error(response)
-            return response
-        except HTTPException as exc:
-            return self.handle_http_exception(exc)
-        except Exception as exc:
-            logger.error(f"Unhandled exception: {exc}")
-            return self.handle_unexpected_exception(exc)
+logger = logging.getLogger(__name__)
 
-    def handle_error(self, response):
-        return JSONResponse(
-            status_code=response.status_code,
-            content={"detail": response.body.decode()},
-        )
 
-    def handle_http_exception(self, exc: HTTPException):
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"detail": exc.detail},
-        )
+class ErrorMiddleware(middleware.ErrorMiddleware):
+    """The generated ``app.core.middleware.ErrorMiddleware``, plus project helpers."""
 
-    def handle_unexpected_exception(self, exc):
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "An unexpected error occurred."},
-        )
-    
     def install(self, app=None):
         """Install the error middleware on a FastAPI app."""
         if app is None:
@@ -57,46 +27,7 @@ class ErrorMiddleware:
             middleware_file = project_path / "app" / "core" / "middleware.py"
             middleware_file.parent.mkdir(parents=True, exist_ok=True)
             
-            middleware_content = '''from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
-import logging
-
-logger = logging.getLogger(__name__)
-
-class ErrorMiddleware:
-    def __init__(self, app):
-        self.app = app
-
-    async def __call__(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-            if response.status_code >= 400:
-                return self.handle_error(response)
-            return response
-        except HTTPException as exc:
-            return self.handle_http_exception(exc)
-        except Exception as exc:
-            logger.error(f"Unhandled exception: {exc}")
-            return self.handle_unexpected_exception(exc)
-
-    def handle_error(self, response):
-        return JSONResponse(
-            status_code=response.status_code,
-            content={"detail": response.body.decode()},
-        )
-
-    def handle_http_exception(self, exc: HTTPException):
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"detail": exc.detail},
-        )
-
-    def handle_unexpected_exception(self, exc):
-        return JSONResponse(
-            status_code=500,
-            content={"detail": "An unexpected error occurred."},
-        )
-'''
+            middleware_content = render_template("middleware.py")
             
             with open(middleware_file, "w", encoding="utf-8") as f:
                 f.write(middleware_content)
@@ -0,0 +1,94 @@
+"""Pick password hashing costs for a target latency on the current machine.
+
+bcrypt's cost doubles with every extra round and argon2's grows linearly with
+``time_cost``, so both are calibrated by stepping the cost up from a safe
+minimum until the next step would exceed the target. Run this on (or on the
+same CPU class as) the deployment host: the right cost depends on the CPU.
+"""
+
+import statistics
+import time
+from typing import Callable, Dict, NamedTuple
+
+CALIBRATION_PASSWORD = b"correct horse battery staple"
+
+# Never recommend less than these, however slow the machine
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+ARGON2_MIN_TIME_COST = 2
+ARGON2_MAX_TIME_COST = 20
+
+
+class CalibrationResult(NamedTuple):
+    scheme: str
+    settings: Dict[str, int]
+    hash_ms: float
+
+    def env_values(self) -> Dict[str, str]:
+        """The result as ``.env`` entries for the generated Settings."""
+        values = {"PASSWORD_HASH_SCHEME": self.scheme}
+        values.update((key.upper(), str(value)) for key, value in self.settings.items())
+        return values
+
+
+def measure_ms(func: Callable[[], object], samples: int = 3) -> float:
+    """Median wall time of ``func`` in milliseconds."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float = 250.0, samples: int = 3) -> CalibrationResult:
+    """Highest bcrypt rounds whose hash time stays within ``target_ms``."""
+    try:
+        import bcrypt
+    except ImportError:
+        raise RuntimeError("bcrypt is not installed. Install it with: pip install bcrypt")
+
+    def timing(rounds: int) -> float:
+        return measure_ms(lambda: bcrypt.hashpw(CALIBRATION_PASSWORD, bcrypt.gensalt(rounds)), samples)
+
+    rounds = BCRYPT_MIN_ROUNDS
+    elapsed = timing(rounds)
+    # Each extra round doubles the cost; stop before the next one overshoots
+    while rounds < BCRYPT_MAX_ROUNDS and elapsed * 2 <= target_ms:
+        rounds += 1
+        elapsed = timing(rounds)
+    return CalibrationResult("bcrypt", {"bcrypt_rounds": rounds}, elapsed)
+
+
+def calibrate_argon2(target_ms: float = 250.0, memory_cost: int = 65536, parallelism: int = 4,
+                     samples: int = 3) -> CalibrationResult:
+    """Highest argon2 ``time_cost`` whose hash time stays within ``target_ms``."""
+    try:
+        from argon2 import PasswordHasher
+    except ImportError:
+        raise RuntimeError("argon2-cffi is not installed. Install it with: pip install argon2-cffi")
+
+    def timing(time_cost: int) -> float:
+        hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+        return measure_ms(lambda: hasher.hash(CALIBRATION_PASSWORD), samples)
+
+    time_cost = ARGON2_MIN_TIME_COST
+    elapsed = timing(time_cost)
+    while time_cost < ARGON2_MAX_TIME_COST:
+        # Cost is roughly linear in time_cost
+        if elapsed * (time_cost + 1) / time_cost > target_ms:
+            break
+        time_cost += 1
+        elapsed = timing(time_cost)
+    settings = {
+        "argon2_time_cost": time_cost,
+        "argon2_memory_cost": memory_cost,
+        "argon2_parallelism": parallelism,
+    }
+    return CalibrationResult("argon2", settings, elapsed)
+
+
+CALIBRATORS = {
+    "bcrypt": calibrate_bcrypt,
+    "argon2": calibrate_argon2,
+}
@@ -1,6 +1,9 @@
 from pathlib import Path
 from typing import Dict, List, Any
 
+from .dependency_resolver import read_pyproject_dependencies, read_requirements_file
+from .project_index import ProjectIndex
+
 class OnboardingReport:
     """Generates an onboarding report for FastAPI projects."""
 
@@ -11,14 +14,17 @@ class OnboardingReport:
         """Generate the onboarding report content."""
         if project_path is None:
             project_path = Path.cwd()
-            
+        project_path = Path(project_path)
+
+        # One walk of the tree feeds every section of the report
+        index = ProjectIndex.build(project_path)
         report_data = {
             "project_name": project_path.name,
             "project_path": str(project_path),
-            "routes": self._discover_routes(project_path),
-            "dependencies": self._analyze_dependencies(project_path),
-            "structure": self._analyze_structure(project_path),
-            "issues": self._identify_issues(project_path),
+            "routes": self._discover_routes(project_path, index),
+            "dependencies": self._analyze_dependencies(project_path, index),
+            "structure": self._analyze_structure(project_path, index),
+            "issues": self._identify_issues(project_path, index),
         }
         return self._render_report(report_data)
 
@@ -32,91 +38,83 @@ class OnboardingReport:
         
         return report_file
 
-    def _discover_routes(self, project_path: Path) -> List[Dict[str, str]]:
+    def _discover_routes(self, project_path: Path, index: ProjectIndex = None) -> List[Dict[str, Any]]:
         """Discover FastAPI routes in the project."""
-        routes = []
-        
-        # Look for main.py and router files
-        main_file = project_path / "app" / "main.py"
-        if main_file.exists():
-            routes.append({"path": "/", "method": "GET", "description": "Root endpoint"})
+        if index is None:
+            index = ProjectIndex.build(project_path)
+
+        routes = [
+            {
+                "path": route.path,
+                "method": route.method,
+                "description": route.description,
+                "handler": route.handler,
+                "file": f"{route.file}:{route.line}",
+                "async": route.is_async,
+                "dependencies": list(route.dependencies),
+            }
+            for route in index.routes
+        ]
+        if any(router.is_app for router in index.routers.values()):
             routes.append({"path": "/docs", "method": "GET", "description": "Interactive API documentation"})
             routes.append({"path": "/redoc", "method": "GET", "description": "ReDoc documentation"})
-        
-        # Look for health endpoint
-        health_file = project_path / "app" / "api" / "v1" / "health.py"
-        if health_file.exists():
-            routes.append({"path": "/api/v1/health/", "method": "GET", "description": "Health check endpoint"})
-        
         return routes
 
-    def _analyze_dependencies(self, project_path: Path) -> List[str]:
+    def _analyze_dependencies(self, project_path: Path, index: ProjectIndex = None) -> List[str]:
         """Analyze project dependencies."""
+        if index is None:
+            index = ProjectIndex.build(project_path)
         dependencies = []
-        
-        # Check requirements.txt
-        requirements_file = project_path / "requirements.txt"
-        if requirements_file.exists():
-            with open(requirements_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        dependencies.append(line)
-        
-        # Check pyproject.toml
-        pyproject_file = project_path / "pyproject.toml"
-        if pyproject_file.exists():
-            dependencies.append("pyproject.toml dependencies (check manually)")
-        
+
+        if index.has_file("requirements.txt"):
+            dependencies.extend(read_requirements_file(project_path / "requirements.txt"))
+        if index.has_file("pyproject.toml"):
+            dependencies.extend(read_pyproject_dependencies(project_path / "pyproject.toml"))
+
         return dependencies if dependencies else ["fastapi", "uvicorn"]
 
-    def _analyze_structure(self, project_path: Path) -> Dict[str, List[str]]:
+    def _analyze_structure(self, project_path: Path, index: ProjectIndex = None) -> Dict[str, List[str]]:
         """Analyze project structure."""
+        if index is None:
+            index = ProjectIndex.build(project_path)
         structure = {}
-        
-        # Analyze app directory
-        app_dir = project_path / "app"
-        if app_dir.exists():
-            app_files = []
-            for item in app_dir.rglob("*"):
-                if item.is_file() and item.suffix == ".py":
-                    app_files.append(str(item.relative_to(app_dir)))
-            structure["app"] = app_files
-        
-        # Analyze tests directory
-        tests_dir = project_path / "tests"
-        if tests_dir.exists():
-            test_files = []
-            for item in tests_dir.rglob("*"):
-                if item.is_file() and item.suffix == ".py":
-                    test_files.append(str(item.relative_to(tests_dir)))
-            structure["tests"] = test_files
-        
+
+        for folder in ("app", "tests"):
+            files = index.files_under(folder)
+            if files:
+                structure[folder] = files
+
         return structure if structure else {
             "app": ["main.py", "api", "core", "models", "schemas"],
             "tests": ["test_main.py", "test_health.py"],
         }
 
-    def _identify_issues(self, project_path: Path) -> List[str]:
+    def _identify_issues(self, project_path: Path, index: ProjectIndex = None) -> List[str]:
         """Identify potential issues in the project."""
+        if index is None:
+            index = ProjectIndex.build(project_path)
         issues = []
-        
+
         # Check for missing files
-        if not (project_path / "app" / "main.py").exists():
-            issues.append("No app/main.py file found")
-        
-        if not (project_path / "requirements.txt").exists():
-            issues.append("No requirements.txt file found")
-        
-        if not (project_path / ".env.example").exists():
-            issues.append("No .env.example file found")
-        
-        if not (project_path / "Dockerfile").exists():
-            issues.append("No Dockerfile found")
-        
-        if not (project_path / "README.md").exists():
-            issues.append("No README.md file found")
-        
+        expected_files = [
+            ("app/main.py", "No app/main.py file found"),
+            ("requirements.txt", "No requirements.txt file found"),
+            (".env.example", "No .env.example file found"),
+            ("Dockerfile", "No Dockerfile found"),
+            ("README.md", "No README.md file found"),
+        ]
+        for rel_path, message in expected_files:
+            if not index.has_file(rel_path):
+                issues.append(message)
+
+        for router in index.unmounted_routers:
+            issues.append(f"Router {router} is never included in an app")
+        for error in index.parse_errors:
+            issues.append(f"Could not parse {error}")
+        sync_routes = [route for route in index.routes if not route.is_async]
+        if sync_routes:
+            issues.append(f"{len(sync_routes)} route handler(s) are sync and run in the threadpool")
+
         return issues
 
     def _render_report(self, report_data: Dict[str, Any]) -> str:
@@ -128,7 +126,14 @@ class OnboardingReport:
             "## Routes",
         ]
         for route in report_data["routes"]:
-            report_lines.append(f"- `{route['method']} {route['path']}`: {route['description']}")
+            line = f"- `{route['method']} {route['path']}`: {route['description']}"
+            if "handler" in route:
+                kind = "async" if route["async"] else "sync"
+                line += f" ({kind} `{route['handler']}` in {route['file']})"
+            if route.get("dependencies"):
+                chain = " -> ".join(dep.rsplit(".", 1)[-1] for dep in route["dependencies"])
+                line += f"; depends on {chain}"
+            report_lines.append(line)
         
         report_lines.append("")
         report_lines.append("## Dependencies")
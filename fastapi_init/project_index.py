@@ -0,0 +1,358 @@
+"""A static index of a FastAPI project, built from one walk of its tree.
+
+Every Python file is parsed once. The index records ``FastAPI``/``APIRouter``
+objects, the routes declared on them (``@router.get(...)``,
+``api_route``/``add_api_route``), ``include_router(..., prefix=...)`` calls
+and module-level functions with their ``Depends`` parameters. Include chains
+are then resolved from each app down to full route paths, so nothing in the
+project is imported or executed.
+"""
+
+import ast
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .utils import iter_project_files
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete", "head", "options", "trace")
+APP_CLASSES = {"fastapi.FastAPI", "fastapi.applications.FastAPI"}
+ROUTER_CLASSES = {"fastapi.APIRouter", "fastapi.routing.APIRouter"}
+DEPENDS_FUNCTIONS = {"fastapi.Depends", "fastapi.Security", "fastapi.params.Depends", "fastapi.params.Security"}
+
+
+class RouteInfo(NamedTuple):
+    """One endpoint with its fully resolved path."""
+
+    method: str
+    path: str
+    handler: str
+    module: str
+    file: str
+    line: int
+    is_async: bool
+    dependencies: Tuple[str, ...]
+    description: str
+
+
+class _Router:
+    __slots__ = ("module", "name", "is_app", "prefix", "dependencies", "routes", "includes")
+
+    def __init__(self, module: str, name: str, is_app: bool, prefix: str, dependencies: List[str]):
+        self.module = module
+        self.name = name
+        self.is_app = is_app
+        self.prefix = prefix
+        self.dependencies = dependencies
+        # (methods, path, function node, decorator dependencies)
+        self.routes: List[tuple] = []
+        # (child reference, prefix, include dependencies)
+        self.includes: List[tuple] = []
+
+    @property
+    def key(self) -> str:
+        return f"{self.module}.{self.name}"
+
+
+def _module_name(rel_path: str) -> str:
+    parts = rel_path[: -len(".py")].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _string(node: Optional[ast.AST]) -> Optional[str]:
+    """Return a literal string, or a ``{expression}`` placeholder for anything else."""
+    if node is None:
+        return None
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    unparse = getattr(ast, "unparse", None)
+    return "{" + (unparse(node) if unparse else "...") + "}"
+
+
+def _keyword(call: ast.Call, name: str) -> Optional[ast.AST]:
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+
+class _ModuleIndexer:
+    """Collects routers, routes, includes and dependency functions for one module."""
+
+    def __init__(self, module: str, rel_path: str, is_package: bool):
+        self.module = module
+        self.rel_path = rel_path
+        self.package = module if is_package else module.rpartition(".")[0]
+        self.aliases: Dict[str, str] = {}
+        self.routers: Dict[str, _Router] = {}
+        self.functions: Dict[str, ast.AST] = {}
+        # Names bound at module level, which qualify as ``<module>.<name>``
+        self.names: Set[str] = set()
+
+    def index(self, tree: ast.Module):
+        for statement in tree.body:
+            if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                self.names.add(statement.name)
+            elif isinstance(statement, ast.Assign):
+                self.names.update(target.id for target in statement.targets if isinstance(target, ast.Name))
+            elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+                self.names.add(statement.target.id)
+
+        calls, assigns, functions = [], [], []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.asname:
+                        self.aliases[alias.asname] = alias.name
+                    else:
+                        top_level = alias.name.split(".", 1)[0]
+                        self.aliases[top_level] = top_level
+            elif isinstance(node, ast.ImportFrom):
+                base = self._absolute(node.module, node.level)
+                for alias in node.names:
+                    if alias.name != "*":
+                        self.aliases[alias.asname or alias.name] = f"{base}.{alias.name}" if base else alias.name
+            elif isinstance(node, ast.Assign):
+                assigns.append(node)
+            elif isinstance(node, ast.Call):
+                calls.append(node)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions.append(node)
+
+        for node in assigns:
+            if isinstance(node.value, ast.Call) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                qualname = self.qualname(node.value.func)
+                if qualname in APP_CLASSES or qualname in ROUTER_CLASSES:
+                    name = node.targets[0].id
+                    self.routers[name] = _Router(
+                        self.module, name, qualname in APP_CLASSES,
+                        _string(_keyword(node.value, "prefix")) or "",
+                        self.dependency_list(_keyword(node.value, "dependencies")),
+                    )
+
+        for node in functions:
+            self.functions[node.name] = node
+            for decorator in node.decorator_list:
+                self._route_from_decorator(decorator, node)
+
+        for node in calls:
+            func = node.func
+            if not isinstance(func, ast.Attribute) or not isinstance(func.value, ast.Name):
+                continue
+            router = self.routers.get(func.value.id)
+            if router is None:
+                continue
+            if func.attr == "include_router" and node.args:
+                router.includes.append((
+                    self._reference(node.args[0]),
+                    _string(_keyword(node, "prefix")) or "",
+                    self.dependency_list(_keyword(node, "dependencies")),
+                ))
+            elif func.attr == "add_api_route" and len(node.args) >= 2:
+                methods = self._methods(_keyword(node, "methods")) or ("GET",)
+                handler = node.args[1]
+                target = self.functions.get(handler.id) if isinstance(handler, ast.Name) else None
+                router.routes.append((methods, _string(node.args[0]), target or handler, []))
+
+    def _route_from_decorator(self, decorator: ast.AST, function: ast.AST):
+        if not isinstance(decorator, ast.Call) or not isinstance(decorator.func, ast.Attribute):
+            return
+        owner = decorator.func.value
+        router = self.routers.get(owner.id) if isinstance(owner, ast.Name) else None
+        if router is None:
+            return
+        attr = decorator.func.attr
+        if attr in HTTP_METHODS:
+            methods = (attr.upper(),)
+        elif attr == "api_route":
+            methods = self._methods(_keyword(decorator, "methods")) or ("GET",)
+        elif attr == "websocket":
+            methods = ("WEBSOCKET",)
+        else:
+            return
+        path = _string(decorator.args[0]) if decorator.args else _string(_keyword(decorator, "path"))
+        dependencies = self.dependency_list(_keyword(decorator, "dependencies"))
+        router.routes.append((methods, path or "", function, dependencies))
+
+    def _methods(self, node: Optional[ast.AST]) -> Tuple[str, ...]:
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            return tuple(
+                element.value.upper() for element in node.elts
+                if isinstance(element, ast.Constant) and isinstance(element.value, str)
+            )
+        return ()
+
+    def _absolute(self, module: Optional[str], level: int) -> str:
+        if not level:
+            return module or ""
+        package = self.package.split(".") if self.package else []
+        if level > 1:
+            package = package[: len(package) - (level - 1)]
+        return ".".join(package + ([module] if module else []))
+
+    def _reference(self, node: ast.AST) -> str:
+        """Qualified name of a router expression, e.g. ``app.api.v1.health.router``."""
+        if isinstance(node, ast.Name) and node.id in self.routers:
+            return f"{self.module}.{node.id}"
+        return self.qualname(node) or ""
+
+    def qualname(self, node: ast.AST) -> Optional[str]:
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return None
+        base = self.aliases.get(node.id)
+        if base is None:
+            base = f"{self.module}.{node.id}" if node.id in self.names else node.id
+        parts.append(base)
+        return ".".join(reversed(parts))
+
+    def dependency_list(self, node: Optional[ast.AST]) -> List[str]:
+        """Dependencies from a ``dependencies=[Depends(...), ...]`` argument."""
+        if not isinstance(node, (ast.List, ast.Tuple)):
+            return []
+        return [dep for dep in (self.depends_target(element) for element in node.elts) if dep]
+
+    def depends_target(self, node: Optional[ast.AST], annotation: Optional[ast.AST] = None) -> Optional[str]:
+        """The callable inside ``Depends(fn)``/``Security(fn)``, if ``node`` is one.
+
+        A bare ``Depends()`` depends on the parameter's annotation.
+        """
+        if not isinstance(node, ast.Call) or self.qualname(node.func) not in DEPENDS_FUNCTIONS:
+            return None
+        target = node.args[0] if node.args else _keyword(node, "dependency")
+        if target is None:
+            target = annotation
+        return (self.qualname(target) if target is not None else None) or "<unknown>"
+
+    def parameter_dependencies(self, function: ast.AST) -> List[str]:
+        """Dependencies declared on a function's parameters (defaults or Annotated)."""
+        if not isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            return []
+        arguments = function.args
+        positional = getattr(arguments, "posonlyargs", []) + arguments.args
+        pairs = list(zip(positional[len(positional) - len(arguments.defaults):], arguments.defaults))
+        pairs += [(arg, default) for arg, default in zip(arguments.kwonlyargs, arguments.kw_defaults) if default is not None]
+        dependencies = [self.depends_target(default, arg.annotation) for arg, default in pairs]
+        for arg in positional + arguments.kwonlyargs:
+            annotation = arg.annotation
+            if isinstance(annotation, ast.Subscript) and isinstance(annotation.slice, ast.Tuple):
+                elements = annotation.slice.elts
+                dependencies.extend(self.depends_target(node, elements[0]) for node in elements[1:])
+        return [dep for dep in dependencies if dep]
+
+
+class ProjectIndex:
+    """Routes, files and dependency graph of a project, from a single walk."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path)
+        self.files: List[str] = []
+        self.parse_errors: List[str] = []
+        self.routers: Dict[str, _Router] = {}
+        self._modules: Dict[str, _ModuleIndexer] = {}
+        self._function_dependencies: Dict[str, List[str]] = {}
+        self.routes: List[RouteInfo] = []
+        self.unmounted_routers: List[str] = []
+
+    @classmethod
+    def build(cls, project_path: Path, exclude=()) -> "ProjectIndex":
+        index = cls(project_path)
+        index._walk(exclude)
+        index._resolve()
+        return index
+
+    def has_file(self, rel_path: str) -> bool:
+        return rel_path in self._file_set
+
+    def files_under(self, directory: str, suffix: str = ".py") -> List[str]:
+        """Files below ``directory``, relative to it."""
+        prefix = directory.rstrip("/") + "/"
+        return [path[len(prefix):] for path in self.files if path.startswith(prefix) and path.endswith(suffix)]
+
+    def _walk(self, exclude):
+        for file_path, rel_path in iter_project_files(self.project_path, suffixes=(), exclude=exclude):
+            self.files.append(rel_path)
+            if not rel_path.endswith(".py"):
+                continue
+            try:
+                with open(file_path, "rb") as f:
+                    source = f.read()
+                tree = ast.parse(source, filename=rel_path)
+            except (OSError, SyntaxError, ValueError) as e:
+                self.parse_errors.append(f"{rel_path}: {e}")
+                continue
+
+            module = _module_name(rel_path)
+            indexer = _ModuleIndexer(module, rel_path, rel_path.endswith("__init__.py"))
+            indexer.index(tree)
+            self._modules[module] = indexer
+            for name, function in indexer.functions.items():
+                self._function_dependencies[f"{module}.{name}"] = indexer.parameter_dependencies(function)
+            for router in indexer.routers.values():
+                self.routers[router.key] = router
+        self._file_set = set(self.files)
+
+    def _resolve(self):
+        included: Set[str] = set()
+        for router in self.routers.values():
+            for child, _, _ in router.includes:
+                included.add(child)
+
+        apps = [router for router in self.routers.values() if router.is_app]
+        # Without an app (e.g. a router-only package), treat top-level routers as roots
+        roots = apps or [router for router in self.routers.values() if router.key not in included]
+        mounted: Set[str] = set()
+        for root in roots:
+            self._collect(root, "", [], mounted, ())
+
+        self.unmounted_routers = sorted(key for key in self.routers if key not in mounted)
+        self.routes.sort(key=lambda route: (route.path, route.method))
+
+    def _collect(self, router: _Router, prefix: str, dependencies: List[str], mounted: Set[str], stack: Tuple[str, ...]):
+        if router.key in stack:
+            return
+        mounted.add(router.key)
+        prefix = prefix + router.prefix
+        dependencies = dependencies + router.dependencies
+        indexer = self._modules[router.module]
+
+        for methods, path, function, route_dependencies in router.routes:
+            handler = getattr(function, "name", None) or indexer.qualname(function) or "<unknown>"
+            chain = self._dependency_chain(
+                dependencies + route_dependencies + indexer.parameter_dependencies(function)
+            )
+            docstring = ast.get_docstring(function) if isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)) else None
+            for method in methods:
+                self.routes.append(RouteInfo(
+                    method=method,
+                    path=(prefix + path) or "/",
+                    handler=handler,
+                    module=router.module,
+                    file=indexer.rel_path,
+                    line=getattr(function, "lineno", 0),
+                    is_async=isinstance(function, ast.AsyncFunctionDef),
+                    dependencies=chain,
+                    description=docstring.strip().splitlines()[0] if docstring else handler.replace("_", " ").capitalize(),
+                ))
+
+        for child_key, include_prefix, include_dependencies in router.includes:
+            child = self.routers.get(child_key)
+            if child is not None:
+                self._collect(child, prefix + include_prefix, dependencies + include_dependencies,
+                              mounted, stack + (router.key,))
+
+    def _dependency_chain(self, dependencies: List[str]) -> Tuple[str, ...]:
+        """Flatten dependencies depth-first through functions defined in the project."""
+        chain: List[str] = []
+        pending = list(reversed(dependencies))
+        while pending:
+            dependency = pending.pop()
+            if dependency in chain:
+                continue
+            chain.append(dependency)
+            pending.extend(reversed(self._function_dependencies.get(dependency, [])))
+        return tuple(chain)
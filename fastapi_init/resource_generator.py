@@ -0,0 +1,224 @@
+"""Generate a CRUD resource (model, schemas, service and router) in a project.
+
+List endpoints page with keyset pagination: each page continues after the
+last row's ``(sort column, id)``, carried in an opaque signed cursor, so the
+database seeks through a composite index instead of counting past an
+``OFFSET``; page 10,000 costs the same as page one. List views select only
+the summary columns, and the detail view loads the parent relationship
+with ``selectinload``; relationships are ``lazy="raise"`` so an accidental
+per-row load fails loudly instead of turning into N+1 queries.
+"""
+
+import keyword
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from .templates import render_template
+from .utils import detect_database_mode
+
+# field type -> (SQLAlchemy column type, Python type)
+FIELD_TYPES = {
+    "str": ("String(255)", "str"),
+    "text": ("Text", "str"),
+    "int": ("Integer", "int"),
+    "float": ("Float", "float"),
+    "bool": ("Boolean", "bool"),
+    "datetime": ("DateTime(timezone=True)", "datetime"),
+}
+FIELD_MODIFIERS = ("index", "optional")
+RESERVED_FIELDS = {"id", "created_at", "updated_at"}
+
+
+class ResourceError(ValueError):
+    """The resource cannot be generated as asked."""
+
+
+class Field(NamedTuple):
+    name: str
+    type: str
+    indexed: bool = False
+    optional: bool = False
+
+    @property
+    def column_type(self) -> str:
+        return FIELD_TYPES[self.type][0]
+
+    @property
+    def python_type(self) -> str:
+        return FIELD_TYPES[self.type][1]
+
+    @property
+    def in_summary(self) -> bool:
+        # Long text stays out of list views
+        return self.type != "text"
+
+
+class Parent(NamedTuple):
+    class_name: str
+    attribute: str  # relationship attribute, e.g. "user"
+    foreign_key: str  # column, e.g. "user_id"
+    model_module: str
+    schema_module: str
+    schema_class: str
+
+
+class Resource(NamedTuple):
+    class_name: str
+    module: str  # snake_case, also the file name
+    table: str
+    url_path: str
+    fields: List[Field]
+    parent: Optional[Parent] = None
+
+    @property
+    def sortable(self) -> List[str]:
+        """Columns a list can be ordered by; each gets a ``(column, id)`` index."""
+        return ["id", "created_at"] + [field.name for field in self.fields if field.indexed]
+
+    @property
+    def summary_fields(self) -> List[Field]:
+        return [field for field in self.fields if field.in_summary]
+
+
+def snake_case(name: str) -> str:
+    name = re.sub(r"[\s\-]+", "_", name.strip())
+    name = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name)
+    return name.lower()
+
+
+def class_name(name: str) -> str:
+    return "".join(part.capitalize() for part in snake_case(name).split("_") if part)
+
+
+def pluralize(word: str) -> str:
+    if re.search(r"[^aeiou]y$", word):
+        return word[:-1] + "ies"
+    if re.search(r"(s|x|z|ch|sh)$", word):
+        return word + "es"
+    return word + "s"
+
+
+def parse_field(spec: str) -> Field:
+    """``"name:str:index"``, ``"price:float"``, ``"notes:text:optional"``."""
+    name, _, rest = spec.partition(":")
+    parts = rest.split(":") if rest else ["str"]
+    field_type, modifiers = parts[0] or "str", parts[1:]
+    if not name.isidentifier() or keyword.iskeyword(name) or name in RESERVED_FIELDS:
+        raise ResourceError(f"Invalid field name {name!r}")
+    if field_type not in FIELD_TYPES:
+        raise ResourceError(f"Unknown type {field_type!r} for {name}; expected one of {', '.join(FIELD_TYPES)}")
+    unknown = [modifier for modifier in modifiers if modifier not in FIELD_MODIFIERS]
+    if unknown:
+        raise ResourceError(f"Unknown modifier {unknown[0]!r} for {name}; expected index or optional")
+    field = Field(name, field_type, "index" in modifiers, "optional" in modifiers)
+    if field.indexed and field.optional:
+        # Keyset comparisons skip NULLs, so sortable columns must be NOT NULL
+        raise ResourceError(f"{name}: indexed fields are sortable and cannot be optional")
+    if field.indexed and field.type == "text":
+        raise ResourceError(f"{name}: use str rather than text for an indexed field")
+    return field
+
+
+def _parent(project_path: Path, name: str) -> Parent:
+    parent_class = class_name(name)
+    module = snake_case(parent_class)
+    attribute = module
+    if (project_path / "app" / "models" / f"{module}.py").exists():
+        model_module = f"app.models.{module}"
+        schema_module, schema_class = f"app.schemas.{module}", f"{parent_class}Summary"
+    else:
+        models_file = project_path / "app" / "models" / "models.py"
+        if not models_file.exists() or f"class {parent_class}(" not in models_file.read_text(encoding="utf-8"):
+            raise ResourceError(f"No model named {parent_class} in app/models")
+        model_module = "app.models.models"
+        schema_module, schema_class = "app.schemas.schemas", parent_class
+    return Parent(parent_class, attribute, f"{attribute}_id", model_module, schema_module, schema_class)
+
+
+def build_resource(project_path: Path, name: str, field_specs: List[str], belongs_to: Optional[str] = None) -> Resource:
+    resource_class = class_name(name)
+    if not resource_class.isidentifier():
+        raise ResourceError(f"Invalid resource name {name!r}")
+    module = snake_case(resource_class)
+    fields = [parse_field(spec) for spec in field_specs] or [Field("name", "str", indexed=True)]
+    names = [field.name for field in fields]
+    if len(set(names)) != len(names):
+        raise ResourceError("Duplicate field names")
+    parent = _parent(project_path, belongs_to) if belongs_to else None
+    if parent is not None and parent.foreign_key in names:
+        raise ResourceError(f"{parent.foreign_key} is added by --belongs-to; do not declare it")
+    table = pluralize(module)
+    return Resource(resource_class, module, table, "/" + table.replace("_", "-"), fields, parent)
+
+
+def _wire_router(project_path: Path, resource: Resource) -> bool:
+    """Include the resource's router in ``api_router``; False if it already is."""
+    router_file = project_path / "app" / "api" / "v1" / "router.py"
+    content = router_file.read_text(encoding="utf-8")
+    import_line = f"from .{resource.table} import router as {resource.table}_router"
+    if import_line in content:
+        return False
+    lines = content.splitlines()
+    last_import = max(index for index, line in enumerate(lines) if line.startswith(("from ", "import ")))
+    lines.insert(last_import + 1, import_line)
+    lines.append(f"api_router.include_router({resource.table}_router)")
+    router_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return True
+
+
+def _register_model(project_path: Path, resource: Resource):
+    # Importing the package registers the model on Base for create_all and Alembic
+    init_file = project_path / "app" / "models" / "__init__.py"
+    content = init_file.read_text(encoding="utf-8") if init_file.exists() else ""
+    line = f"from . import {resource.module}  # noqa: F401"
+    if line not in content.splitlines():
+        if content and not content.endswith("\n"):
+            content += "\n"
+        init_file.write_text(content + line + "\n", encoding="utf-8")
+
+
+def generate_resource(
+    project_path: Path,
+    name: str,
+    field_specs: Optional[List[str]] = None,
+    belongs_to: Optional[str] = None,
+    force: bool = False,
+    bulk: bool = False,
+) -> List[Path]:
+    """Write the resource's files and wire its router; returns the files written.
+
+    With ``bulk`` the router also gets streaming NDJSON ``POST /bulk`` and
+    ``GET /export`` endpoints, and ``scripts/`` a benchmark for them.
+    """
+    project_path = Path(project_path)
+    if not (project_path / "app" / "api" / "v1" / "router.py").exists():
+        raise ResourceError("app/api/v1/router.py not found; run this from a generated project")
+    database_mode = detect_database_mode(project_path)
+    if database_mode is None:
+        raise ResourceError("app/core/database.py not found; resources need the generated database setup")
+    resource = build_resource(project_path, name, field_specs or [], belongs_to)
+
+    files = {
+        project_path / "app" / "models" / f"{resource.module}.py": "resource_model.py",
+        project_path / "app" / "schemas" / f"{resource.module}.py": "resource_schemas.py",
+        project_path / "app" / "services" / f"{resource.module}.py": "resource_service.py",
+        project_path / "app" / "api" / "v1" / f"{resource.table}.py": "resource_router.py",
+    }
+    if bulk:
+        files[project_path / "scripts" / f"bench_{resource.table}_bulk.py"] = "resource_bench_bulk.py"
+    existing = [path for path in files if path.exists()]
+    if existing and not force:
+        raise ResourceError(f"{existing[0].relative_to(project_path)} already exists; use --force to overwrite")
+
+    written = []
+    pagination_file = project_path / "app" / "core" / "pagination.py"
+    if not pagination_file.exists():
+        files[pagination_file] = "pagination.py"
+    for path, template in files.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(render_template(template, resource=resource, database_mode=database_mode, bulk=bulk), encoding="utf-8")
+        written.append(path)
+    _register_model(project_path, resource)
+    _wire_router(project_path, resource)
+    return written
@@ -1,22 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
-from fastapi_init.templates import TEMPLATES
-from jinja2 import Environment, DictLoader
+from typing import Any, Dict, Optional
+from fastapi_init.templates import get_template_env
+
+# Rendering happens on the calling thread; file writes go to this many threads
+WRITE_WORKERS = 8
+
+DATABASE_MODES = ("sync", "async")
+
+SERVER_PROFILES = ("gunicorn", "uvicorn")
 
 class ProjectScaffolder:
     """Handles the creation of the project structure and files based on templates."""
 
     def __init__(self):
-        # Use the shared TEMPLATES dictionary for all templates
-        self.template_env = Environment(loader=DictLoader(TEMPLATES))
-
-    def create_project_scaffold(self, project_name: str, base_path: Path = None) -> Path:
-        """Create a new FastAPI project scaffold."""
+        # All scaffolders share one Environment and its compiled-template caches
+        self.template_env = get_template_env()
+
+    def create_project_scaffold(self, project_name: str, base_path: Path = None, database_mode: str = "sync",
+                                fast_json: bool = False, server_profile: Optional[str] = None) -> Path:
+        """Create a new FastAPI project scaffold.
+
+        ``database_mode`` is ``"sync"`` (Session/create_engine) or ``"async"``
+        (AsyncSession/create_async_engine with aiosqlite or asyncpg).
+        ``fast_json`` makes orjson the default response encoder and adds
+        ``app/core/responses.py`` and a serialization benchmark.
+        ``server_profile`` (``"gunicorn"`` or ``"uvicorn"``) runs production
+        with several workers sized to the container's CPU quota.
+        """
+        if database_mode not in DATABASE_MODES:
+            raise ValueError(f"Unknown database mode {database_mode!r}; expected one of {', '.join(DATABASE_MODES)}")
+        if server_profile is not None and server_profile not in SERVER_PROFILES:
+            raise ValueError(f"Unknown server profile {server_profile!r}; expected one of {', '.join(SERVER_PROFILES)}")
         if base_path is None:
             base_path = Path.cwd()
         
         project_path = base_path / project_name
-        config = {"project_name": project_name}
+        config = {
+            "project_name": project_name,
+            "database_mode": database_mode,
+            "fast_json": fast_json,
+            "server_profile": server_profile,
+        }
         
         self.create_project_structure(project_path, config)
         return project_path
@@ -65,7 +90,11 @@ class ProjectScaffolder:
             "main.py": "app/main.py",
             "config.py": "app/core/config.py",
             "database.py": "app/core/database.py",
+            "probes.py": "app/core/probes.py",
+            "startup.py": "app/core/startup.py",
             "auth.py": "app/core/auth.py",
+            "hashing.py": "app/core/hashing.py",
+            "principal_cache.py": "app/core/principal_cache.py",
             "logging.py": "app/core/logging.py",
             "middleware.py": "app/core/middleware.py",
             "models.py": "app/models/models.py",
@@ -84,66 +113,51 @@ class ProjectScaffolder:
             "requirements-dev.txt": "requirements-dev.txt",
             ".pre-commit-config.yaml": ".pre-commit-config.yaml",
         }
-
-        # Generate each file
+        if config.get("fast_json"):
+            file_mapping["responses.py"] = "app/core/responses.py"
+            file_mapping["bench_json.py"] = "scripts/bench_json.py"
+        if config.get("server_profile"):
+            file_mapping["server.py"] = "app/core/server.py"
+        if config.get("server_profile") == "gunicorn":
+            file_mapping["gunicorn.conf.py"] = "gunicorn.conf.py"
+
+        files = {}
         for template_name, file_path in file_mapping.items():
             try:
-                template = self.template_env.get_template(template_name)
-                content = template.render(**config)
+                files[file_path] = self.template_env.get_template(template_name).render(**config)
+            except Exception as e:
+                raise RuntimeError(f"Failed to generate {file_path}: {e}") from e
 
-                full_path = project_path / file_path
-                full_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_files(project_path, files)
 
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+    def _write_files(self, project_path: Path, files: Dict[str, str]):
+        """Write rendered files concurrently on a thread pool."""
+        for file_path in files:
+            (project_path / file_path).parent.mkdir(parents=True, exist_ok=True)
 
-            except Exception as e:
-                raise RuntimeError(f"Failed to generate {file_path}: {e}") from e
+        def write(file_path: str, content: str):
+            with open(project_path / file_path, "w", encoding="utf-8") as f:
+                f.write(content)
+
+        with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(files) or 1)) as pool:
+            futures = {file_path: pool.submit(write, file_path, content) for file_path, content in files.items()}
+        for file_path, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                raise RuntimeError(f"Failed to generate {file_path}: {error}") from error
 
     def _setup_alembic(self, project_path: Path, config: Dict[str, Any]):
         """Set up Alembic for database migrations."""
+        alembic_templates = {
+            "alembic.ini": "alembic.ini",
+            "alembic_env.py": "alembic/env.py",
+            "alembic_script.py.mako": "alembic/script.py.mako",
+        }
         try:
-            # Create alembic.ini
-            alembic_ini_content = self.template_env.get_template("alembic.ini").render(**config)
-            alembic_ini_path = project_path / "alembic.ini"
-            with open(alembic_ini_path, "w", encoding="utf-8") as f:
-                f.write(alembic_ini_content)
-            
-            # Create alembic/env.py
-            alembic_env_content = self.template_env.get_template("alembic_env.py").render(**config)
-            alembic_env_path = project_path / "alembic" / "env.py"
-            with open(alembic_env_path, "w", encoding="utf-8") as f:
-                f.write(alembic_env_content)
-            
-            # Create alembic/script.py.mako
-            script_mako_content = """\"\"\"${message}
-
-Revision ID: ${up_revision}
-Revises: ${down_revision | comma,n}
-Create Date: ${create_date}
-
-\"\"\"
-from alembic import op
-import sqlalchemy as sa
-${imports if imports else ""}
-
-# revision identifiers, used by Alembic.
-revision = ${repr(up_revision)}
-down_revision = ${repr(down_revision)}
-branch_labels = ${repr(branch_labels)}
-depends_on = ${repr(depends_on)}
-
-
-def upgrade() -> None:
-    ${upgrades if upgrades else "pass"}
-
-
-def downgrade() -> None:
-    ${downgrades if downgrades else "pass"}
-"""
-            script_mako_path = project_path / "alembic" / "script.py.mako"
-            with open(script_mako_path, "w", encoding="utf-8") as f:
-                f.write(script_mako_content)
-                
+            files = {
+                file_path: self.template_env.get_template(template_name).render(**config)
+                for template_name, file_path in alembic_templates.items()
+            }
+            self._write_files(project_path, files)
         except Exception as e:
-            raise RuntimeError(f"Failed to setup Alembic: {e}") from e
\ No newline at end of file
+            raise RuntimeError(f"Failed to setup Alembic: {e}") from e
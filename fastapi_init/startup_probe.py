@@ -0,0 +1,177 @@
+"""Cold-start one app and time each phase; run by ``startup_profiler`` in a fresh interpreter.
+
+    python -X importtime startup_probe.py <module:attribute> <path or ""> <output.json>
+
+Run as a script, not imported: only what the app itself needs gets imported
+before the ``import`` phase is timed. Each phase writes a marker to stderr,
+so the importtime lines that follow it can be attributed to that phase.
+"""
+
+import os
+import sys
+import time
+
+PHASE_MARKER = "-- startup phase: "
+CO_SUSPENDABLE = 0x20 | 0x80 | 0x200  # CO_GENERATOR | CO_COROUTINE | CO_ASYNC_GENERATOR
+
+
+def mark(phase):
+    sys.stderr.write(f"{PHASE_MARKER}{phase}\n")
+    sys.stderr.flush()
+
+
+class LineTimer:
+    """Wall time per line of the outermost project function running, e.g. the lifespan body.
+
+    A line's time runs until the next line of the same frame starts, so it
+    includes everything the line calls and awaits. Only project frames
+    called from outside the project are traced; the functions they call are
+    not, which keeps the tracing overhead to one check per call.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.join(os.path.abspath(root), "")
+        self.lines = {}
+        self.pending = {}
+        self._project = {}
+
+    def is_project(self, filename):
+        project = self._project.get(filename)
+        if project is None:
+            # "<string>" and other generated code have no file to be part of
+            path = os.path.abspath(filename)
+            project = not filename.startswith("<") and path.startswith(self.root) and "site-packages" not in path
+            self._project[filename] = project
+        return project
+
+    def start(self):
+        sys.settrace(self._call)
+
+    def stop(self):
+        sys.settrace(None)
+        # Whatever is still running, like the lifespan's yield, is not startup
+        self.pending.clear()
+
+    def _call(self, frame, event, arg):
+        if not self.is_project(frame.f_code.co_filename):
+            return None
+        caller = frame.f_back
+        while caller is not None:
+            if self.is_project(caller.f_code.co_filename):
+                return None
+            caller = caller.f_back
+        return self._trace
+
+    def _close(self, frame, now):
+        pending = self.pending.pop(frame, None)
+        if pending is not None:
+            key, began = pending
+            self.lines[key] = self.lines.get(key, 0.0) + now - began
+
+    def _trace(self, frame, event, arg):
+        now = time.perf_counter()
+        if event == "line":
+            self._close(frame, now)
+            self.pending[frame] = ((frame.f_code.co_filename, frame.f_lineno), now)
+        elif event == "return" and not frame.f_code.co_flags & CO_SUSPENDABLE:
+            self._close(frame, now)
+        # A suspended coroutine keeps its line open: the await is that line's time
+        return self._trace
+
+
+async def request(app, path):
+    """One GET through the ASGI interface, without an HTTP client."""
+    status = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "server": ("startup", 80), "client": ("127.0.0.1", 0), "root_path": "",
+        "path": path, "raw_path": path.encode(), "query_string": b"", "headers": [(b"host", b"startup")],
+    }
+    await app(scope, receive, send)
+    return status[0] if status else 0
+
+
+def default_path(app):
+    """The first GET route without path parameters, skipping the docs and other unlisted routes."""
+    for route in getattr(app, "routes", []):
+        path = getattr(route, "path", "")
+        listed = getattr(route, "include_in_schema", True)
+        if listed and "GET" in (getattr(route, "methods", None) or ()) and "{" not in path:
+            return path
+    return "/"
+
+
+def main():
+    spec, path, output = sys.argv[1:4]
+    root = os.getcwd()
+    # Run as a script, sys.path[0] is this file's directory; the app lives in the cwd
+    sys.path[0] = root
+    phases = {}
+
+    mark("import")
+    began = time.perf_counter()
+    module_name, _, attribute = spec.partition(":")
+    # __import__, not importlib.import_module: -X importtime only reports imports made through it
+    __import__(module_name)
+    app = getattr(sys.modules[module_name], attribute or "app")
+    phases["import"] = time.perf_counter() - began
+
+    import asyncio
+    import json
+
+    async def run():
+        context = getattr(getattr(app, "router", None), "lifespan_context", None)
+        timer = LineTimer(root)
+        mark("lifespan")
+        began = time.perf_counter()
+        lifespan = context(app) if context is not None else None
+        if lifespan is not None:
+            timer.start()
+            try:
+                await lifespan.__aenter__()
+            finally:
+                timer.stop()
+        phases["lifespan"] = time.perf_counter() - began
+
+        mark("openapi")
+        began = time.perf_counter()
+        if hasattr(app, "openapi"):
+            app.openapi()
+        phases["openapi"] = time.perf_counter() - began
+
+        target = path or default_path(app)
+        mark("first_request")
+        began = time.perf_counter()
+        status = await request(app, target)
+        phases["first_request"] = time.perf_counter() - began
+
+        mark("second_request")
+        began = time.perf_counter()
+        await request(app, target)
+        phases["second_request"] = time.perf_counter() - began
+
+        mark("shutdown")
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+        return target, status, timer.lines
+
+    target, status, lines = asyncio.run(run())
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "phases": {name: seconds * 1000 for name, seconds in phases.items()},
+            "path": target,
+            "status": status,
+            "lines": [[os.path.relpath(filename, root), lineno, seconds * 1000] for (filename, lineno), seconds in lines.items()],
+        }, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Where a project's cold start goes: imports, lifespan, OpenAPI and the first request.
+
+Each run starts a fresh interpreter under ``-X importtime`` and drives
+``startup_probe.py`` in the project directory: it imports the app, enters
+its lifespan (the schema check, the warm-up and whatever else startup
+does), builds the OpenAPI schema and sends the first requests, timing each
+phase. The importtime report is split by the phase markers the probe writes,
+so imports deferred until the first request are charged to it, and the
+lifespan is timed line by line.
+"""
+
+import json
+import linecache
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .startup_probe import PHASE_MARKER
+
+PROBE = Path(__file__).with_name("startup_probe.py")
+PHASES = ("import", "lifespan", "openapi", "first_request")
+# Imports before the probe's first marker are the interpreter's own
+STARTUP_PHASE = "interpreter"
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    phase: str
+
+
+class LineTiming(NamedTuple):
+    location: str  # "app/main.py:20"
+    source: str
+    ms: float
+
+
+class ImportGroup(NamedTuple):
+    name: str  # top-level package, or the full module name for project code
+    self_ms: float
+    modules: int
+
+
+class StartupProfile(NamedTuple):
+    phases: Dict[str, float]  # milliseconds
+    path: str
+    status: int
+    imports: List[ImportRecord]
+    lifespan_lines: List[LineTiming]
+
+    @property
+    def ready_ms(self) -> float:
+        """Until the server would accept connections: the import and the lifespan startup."""
+        return self.phases.get("import", 0.0) + self.phases.get("lifespan", 0.0)
+
+    @property
+    def total_ms(self) -> float:
+        """Until the first response, including the OpenAPI schema built on first use."""
+        return sum(self.phases.get(phase, 0.0) for phase in PHASES)
+
+    def import_ms_by_phase(self) -> Dict[str, float]:
+        """Self time of the imports each phase triggered."""
+        totals: Dict[str, float] = {}
+        for record in self.imports:
+            totals[record.phase] = totals.get(record.phase, 0.0) + record.self_ms
+        return totals
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """``-X importtime`` lines, each tagged with the phase the probe had marked last."""
+    records = []
+    phase = STARTUP_PHASE
+    for line in stderr.splitlines():
+        if line.startswith(PHASE_MARKER):
+            phase = line[len(PHASE_MARKER):].strip()
+            continue
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        records.append(ImportRecord(fields[2].strip(), int(fields[0]) / 1000, int(fields[1]) / 1000, phase))
+    return records
+
+
+def _project_packages(project_path: Path) -> set:
+    return {path.stem for path in project_path.iterdir() if path.suffix == ".py" or (path / "__init__.py").exists()}
+
+
+def group_imports(records: List[ImportRecord], project_path: Path) -> List[ImportGroup]:
+    """Self time per top-level package, slowest first; project modules stay separate."""
+    project = _project_packages(Path(project_path))
+    totals: Dict[str, List[float]] = {}
+    for record in records:
+        if record.phase == STARTUP_PHASE:
+            continue
+        top = record.module.split(".")[0]
+        name = record.module if top in project else top
+        total = totals.setdefault(name, [0.0, 0])
+        total[0] += record.self_ms
+        total[1] += 1
+    groups = [ImportGroup(name, self_ms, int(count)) for name, (self_ms, count) in totals.items()]
+    return sorted(groups, key=lambda group: group.self_ms, reverse=True)
+
+
+def _tail(stderr: str, lines: int = 20) -> str:
+    kept = [line for line in stderr.splitlines() if not line.startswith(("import time:", PHASE_MARKER))]
+    return "\n".join(kept[-lines:])
+
+
+def run_probe(project_path: Path, app_spec: str = "app.main:app", path: Optional[str] = None) -> StartupProfile:
+    """One cold start in a fresh interpreter."""
+    project_path = Path(project_path).resolve()
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "profile.json")
+        command = [sys.executable, "-X", "importtime", str(PROBE), app_spec, path or "", output]
+        result = subprocess.run(command, cwd=project_path, capture_output=True, text=True)
+        if result.returncode != 0 or not os.path.exists(output):
+            raise RuntimeError(f"Starting {app_spec} failed:\n{_tail(result.stderr)}")
+        with open(output, encoding="utf-8") as f:
+            data = json.load(f)
+
+    lines = []
+    for filename, lineno, ms in data["lines"]:
+        source = linecache.getline(str(project_path / filename), lineno).strip()
+        lines.append(LineTiming(f"{filename}:{lineno}", source, ms))
+    lines.sort(key=lambda line: line.ms, reverse=True)
+    return StartupProfile(data["phases"], data["path"], data["status"], parse_importtime(result.stderr), lines)
+
+
+def measure_startup(
+    project_path: Path, app_spec: str = "app.main:app", path: Optional[str] = None, runs: int = 1,
+) -> StartupProfile:
+    """Median phases over ``runs`` cold starts; imports and lines come from the median run."""
+    profiles = [run_probe(project_path, app_spec, path) for _ in range(runs)]
+    ordered = sorted(profiles, key=lambda profile: profile.total_ms)
+    median = ordered[(len(ordered) - 1) // 2]
+    phases = {name: statistics.median(profile.phases[name] for profile in profiles) for name in median.phases}
+    return median._replace(phases=phases)
+
+
+def to_dict(profile: StartupProfile, project_path: Path, app_spec: str, runs: int, top: int = 20) -> Dict[str, Any]:
+    """The profile as JSON-ready data, for CI to keep and compare across builds."""
+    return {
+        "app": app_spec,
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "path": profile.path,
+        "status": profile.status,
+        "ready_ms": round(profile.ready_ms, 3),
+        "total_ms": round(profile.total_ms, 3),
+        "phases_ms": {name: round(ms, 3) for name, ms in profile.phases.items()},
+        "imports_ms_by_phase": {name: round(ms, 3) for name, ms in profile.import_ms_by_phase().items()},
+        "imports": [
+            {"name": group.name, "self_ms": round(group.self_ms, 3), "modules": group.modules}
+            for group in group_imports(profile.imports, project_path)[:top]
+        ],
+        "lifespan_lines": [
+            {"location": line.location, "source": line.source, "ms": round(line.ms, 3)}
+            for line in profile.lifespan_lines[:top]
+        ],
+    }
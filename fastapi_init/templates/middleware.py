@@ -0,0 +1,78 @@
+import json
+import logging
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+UNEXPECTED_ERROR_DETAIL = "An unexpected error occurred."
+
+
+def _encode_detail(detail) -> bytes:
+    return json.dumps({"detail": detail}).encode("utf-8")
+
+
+# Bodies for the standard error phrases and the generic 500, encoded once
+ERROR_BODIES = {status.phrase: _encode_detail(status.phrase) for status in HTTPStatus if status.value >= 400}
+ERROR_BODIES[UNEXPECTED_ERROR_DETAIL] = _encode_detail(UNEXPECTED_ERROR_DETAIL)
+
+
+class ErrorMiddleware:
+    """Turns unhandled exceptions into JSON error responses.
+
+    This is a plain ASGI middleware: responses, including streaming ones, are
+    passed through untouched and ``send`` is only wrapped to know whether the
+    response has already started.
+    """
+
+    def __init__(self, app=None):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                # Headers are already on the wire; let the server close the connection
+                raise
+            if isinstance(exc, HTTPException):
+                status_code, body, headers = self.handle_http_exception(exc)
+            else:
+                logger.exception("Unhandled exception: %s", exc)
+                status_code, body, headers = self.handle_unexpected_exception(exc)
+            await self.send_error(send, status_code, body, headers)
+
+    def handle_http_exception(self, exc: HTTPException):
+        """Return (status_code, body, extra headers) for an HTTPException."""
+        body = ERROR_BODIES.get(exc.detail) if isinstance(exc.detail, str) else None
+        if body is None:
+            body = _encode_detail(exc.detail)
+        return exc.status_code, body, getattr(exc, "headers", None)
+
+    def handle_unexpected_exception(self, exc: Exception):
+        """Return (status_code, body, extra headers) for any other exception."""
+        return 500, ERROR_BODIES[UNEXPECTED_ERROR_DETAIL], None
+
+    async def send_error(self, send, status_code: int, body: bytes, headers=None):
+        raw_headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        if headers:
+            raw_headers.extend((key.lower().encode("latin-1"), value.encode("latin-1")) for key, value in headers.items())
+        await send({"type": "http.response.start", "status": status_code, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": body})
+
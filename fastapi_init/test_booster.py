@@ -1,7 +1,7 @@
-from fastapi import FastAPI
-from fastapi.testclient import TestClient
+import sys
 from pathlib import Path
-import pytest
+from fastapi_init.templates import render_template
+from fastapi_init.utils import detect_database_mode
 
 class TestBooster:
     """Provides testing utilities and setup for FastAPI projects."""
@@ -32,44 +32,30 @@ class TestBooster:
         tests_dir.mkdir(exist_ok=True)
         
         # Create conftest.py
-        conftest_content = '''import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-@pytest.fixture
-def client():
-    return TestClient(app)
-
-@pytest.fixture
-def app_instance():
-    return app
-'''
+        conftest_content = render_template("conftest.py", database_mode=detect_database_mode(project_path))
         
         conftest_file = tests_dir / "conftest.py"
         with open(conftest_file, "w", encoding="utf-8") as f:
             f.write(conftest_content)
         
         # Create test_main.py
-        test_main_content = '''import pytest
-from fastapi.testclient import TestClient
-
-def test_root_endpoint(client: TestClient):
+        test_main_content = '''async def test_root_endpoint(client):
     """Test the root endpoint."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
 
-def test_health_endpoint(client: TestClient):
+async def test_health_endpoint(client):
     """Test the health check endpoint."""
-    response = client.get("/api/v1/health/")
+    response = await client.get("/api/v1/health/")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
 
-def test_docs_endpoint(client: TestClient):
+async def test_docs_endpoint(client):
     """Test that the docs endpoint is accessible."""
-    response = client.get("/docs")
+    response = await client.get("/docs")
     assert response.status_code == 200
 '''
         
@@ -81,20 +67,9 @@ def test_docs_endpoint(client: TestClient):
         test_api_dir = tests_dir / "api"
         test_api_dir.mkdir(exist_ok=True)
         
-        test_health_content = '''import pytest
-from fastapi.testclient import TestClient
-
-def test_health_check(client: TestClient):
+        test_health_content = '''async def test_health_check(client):
     """Test the health check endpoint."""
-    response = client.get("/api/v1/health/")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "healthy"
-
-@pytest.mark.asyncio
-async def test_health_check_async(client: TestClient):
-    """Test the health check endpoint asynchronously."""
-    response = client.get("/api/v1/health/")
+    response = await client.get("/api/v1/health/")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -104,35 +79,35 @@ async def test_health_check_async(client: TestClient):
         with open(test_health_file, "w", encoding="utf-8") as f:
             f.write(test_health_content)
         
-        # Create pytest.ini
-        pytest_ini_content = '''[tool:pytest]
-asyncio_mode = auto
-testpaths = tests
-python_files = test_*.py
-python_classes = Test*
-python_functions = test_*
-'''
-        
+        # The same pytest.ini `init` generates: one session-wide event loop,
+        # so the app starts once and every test shares it
         pytest_ini_file = project_path / "pytest.ini"
         with open(pytest_ini_file, "w", encoding="utf-8") as f:
-            f.write(pytest_ini_content)
+            f.write(render_template("pytest.ini"))
 
+def create_example_app():
+    """Build the small example app that used to be created at import time."""
+    from fastapi import FastAPI
 
-# Legacy code for backward compatibility
-# Create a FastAPI instance for testing
-app = FastAPI()
+    app = FastAPI()
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
 
-# Test client for making requests to the FastAPI app
-client = TestClient(app)
+    return app
 
-def test_health_check():
-    response = client.get("/health")
-    assert response.status_code == 200
-    assert response.json() == {"status": "healthy"}
 
-# Additional test cases can be added here
-# This file is intentionally left blank for future test cases.
\ No newline at end of file
+def __getattr__(name):
+    # Legacy module-level ``app``/``client`` are built on first access so that
+    # importing this module does not pull in FastAPI or the test client.
+    global app, client
+    if name == "app":
+        app = create_example_app()
+        return app
+    if name == "client":
+        from fastapi.testclient import TestClient
+
+        client = TestClient(sys.modules[__name__].app)
+        return client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,8 @@
 import os
+import fnmatch
 import logging
+from pathlib import Path
+from typing import Dict, Optional
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -27,4 +30,118 @@ def write_file(file_path: str, content: str) -> None:
 
 def ensure_directory_exists(directory_path: str) -> None:
     """Ensure that a directory exists; create it if it does not."""
-    os.makedirs(directory_path, exist_ok=True)
\ No newline at end of file
+    os.makedirs(directory_path, exist_ok=True)
+
+def get_cache_dir(*parts: str) -> Path:
+    """Return (and create) the toolkit cache directory, optionally a subdirectory of it.
+
+    Honours ``FASTAPI_INIT_CACHE_DIR`` first, then ``XDG_CACHE_HOME``, and falls
+    back to ``~/.cache/fastapi-init``.
+    """
+    base = os.environ.get("FASTAPI_INIT_CACHE_DIR")
+    if base:
+        cache_dir = Path(base)
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        cache_dir = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+        cache_dir = cache_dir / "fastapi-init"
+    cache_dir = cache_dir.joinpath(*parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def detect_database_mode(project_path: Path) -> Optional[str]:
+    """"async" or "sync" for a generated project's SQLAlchemy setup, None without one."""
+    database_file = Path(project_path) / "app" / "core" / "database.py"
+    if not database_file.exists():
+        return None
+    return "async" if "create_async_engine" in database_file.read_text(encoding="utf-8") else "sync"
+
+
+DEFAULT_EXCLUDES = (
+    ".git", ".hg", ".svn", ".venv", "venv", "node_modules", "__pycache__", "site-packages",
+    ".tox", ".nox", ".eggs", "*.egg-info", ".mypy_cache", ".pytest_cache", ".ruff_cache", "build", "dist",
+)
+
+
+def _parse_ignore_pattern(base: str, pattern: str):
+    """Turn one .gitignore line into a (base, pattern, negate, dir_only, anchored) rule."""
+    pattern = pattern.rstrip("\n").rstrip()
+    if not pattern or pattern.startswith("#"):
+        return None
+    negate = pattern.startswith("!")
+    if negate:
+        pattern = pattern[1:]
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if pattern.startswith("**/"):
+        pattern = pattern[3:]
+    anchored = "/" in pattern
+    return base, pattern.lstrip("/"), negate, dir_only, anchored
+
+
+def _is_ignored(rel_path: str, is_dir: bool, rules: list) -> bool:
+    """Apply gitignore-style rules in order; the last matching rule wins."""
+    ignored = False
+    name = rel_path.rsplit("/", 1)[-1]
+    for base, pattern, negate, dir_only, anchored in rules:
+        if dir_only and not is_dir:
+            continue
+        if base:
+            if not rel_path.startswith(base + "/"):
+                continue
+            candidate = rel_path[len(base) + 1:]
+        else:
+            candidate = rel_path
+        if fnmatch.fnmatchcase(candidate if anchored else name, pattern):
+            ignored = not negate
+    return ignored
+
+
+def iter_project_files(root: Path, suffixes=(".py",), exclude=(), use_gitignore: bool = True):
+    """Yield ``(path, relative_posix_path)`` for project files, in one directory walk.
+
+    Vendored and tooling directories in ``DEFAULT_EXCLUDES``, extra ``exclude``
+    globs, and ``.gitignore`` files found during the walk (root and nested) are
+    honoured; ignored directories are pruned rather than descended into.
+    """
+    root = Path(root)
+    rules = [_parse_ignore_pattern("", pattern) for pattern in tuple(DEFAULT_EXCLUDES) + tuple(exclude)]
+    rules = [rule for rule in rules if rule is not None]
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root).replace(os.sep, "/")
+        rel_dir = "" if rel_dir == "." else rel_dir
+
+        if use_gitignore and ".gitignore" in filenames:
+            try:
+                with open(os.path.join(dirpath, ".gitignore"), "r", encoding="utf-8") as f:
+                    rules = rules + [rule for rule in (_parse_ignore_pattern(rel_dir, line) for line in f) if rule]
+            except (OSError, UnicodeDecodeError):
+                pass
+
+        prefix = rel_dir + "/" if rel_dir else ""
+        dirnames[:] = sorted(d for d in dirnames if not _is_ignored(prefix + d, True, rules))
+        for filename in sorted(filenames):
+            if suffixes and not filename.endswith(tuple(suffixes)):
+                continue
+            rel_path = prefix + filename
+            if not _is_ignored(rel_path, False, rules):
+                yield Path(dirpath) / filename, rel_path
+
+def update_env_file(env_file: Path, values: Dict[str, str]) -> None:
+    """Set ``KEY=value`` entries in a dotenv file, keeping every other line.
+
+    Existing keys are matched case-insensitively and replaced in place; new
+    keys are appended. The file is created if it does not exist.
+    """
+    env_file = Path(env_file)
+    lines = env_file.read_text(encoding="utf-8").splitlines() if env_file.exists() else []
+    pending = {key.upper(): (key, value) for key, value in values.items()}
+    for index, line in enumerate(lines):
+        key = line.split("=", 1)[0].strip()
+        if "=" in line and not line.lstrip().startswith("#") and key.upper() in pending:
+            name, value = pending.pop(key.upper())
+            lines[index] = f"{name}={value}"
+    lines.extend(f"{name}={value}" for name, value in pending.values())
+    env_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
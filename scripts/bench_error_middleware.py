@@ -0,0 +1,108 @@
+# Microbenchmark: per-request overhead of ErrorMiddleware
+#
+# Drives a FastAPI app directly through ASGI (no server, no HTTP client) so
+# the numbers only contain routing, the endpoint and the middleware. Compares
+# no middleware, the previous BaseHTTPMiddleware/call_next implementation and
+# the current pure ASGI one, for a JSON endpoint and a streaming endpoint.
+#
+#   python scripts/bench_error_middleware.py [requests]
+
+import asyncio
+import sys
+import time
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from fastapi_init.error_middleware import ErrorMiddleware
+
+
+class LegacyErrorMiddleware(BaseHTTPMiddleware):
+    """The call_next implementation ErrorMiddleware replaced."""
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except HTTPException as exc:
+            return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
+        except Exception:
+            return JSONResponse(status_code=500, content={"detail": "An unexpected error occurred."})
+
+
+def create_app(middleware=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/json")
+    async def json_endpoint():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream_endpoint():
+        async def chunks():
+            for _ in range(10):
+                yield b"x" * 1024
+        return StreamingResponse(chunks())
+
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def run(app, path: str, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+    }
+
+    async def send(message):
+        pass
+
+    async def request():
+        # Like a real server: the body arrives once, then receive() blocks
+        # until the client disconnects, which never happens here.
+        received = False
+        disconnected = asyncio.Event()
+
+        async def receive():
+            nonlocal received
+            if not received:
+                received = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await disconnected.wait()
+
+        await app(dict(scope), receive, send)
+
+    # Warm up routing and the middleware stack
+    for _ in range(100):
+        await request()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request()
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    variants = [
+        ("no middleware", create_app()),
+        ("BaseHTTPMiddleware (legacy)", create_app(LegacyErrorMiddleware)),
+        ("pure ASGI ErrorMiddleware", create_app(ErrorMiddleware)),
+    ]
+    for path in ("/json", "/stream"):
+        print(f"GET {path} ({requests} requests)")
+        baseline = None
+        for name, app in variants:
+            per_request = asyncio.run(run(app, path, requests))
+            if baseline is None:
+                baseline = per_request
+                print(f"  {name:<30} {per_request:8.1f} us/request")
+            else:
+                print(f"  {name:<30} {per_request:8.1f} us/request  (+{per_request - baseline:.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
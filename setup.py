@@ -20,6 +20,9 @@ setup(
     url="https://github.com/rameshkannanyt/fastapi-init",
     packages=find_packages(),
     include_package_data=True,
+    package_data={
+        "fastapi_init": ["templates/*.jinja", "templates/.*.jinja"],
+    },
     install_requires=[
         "fastapi>=0.100",
         "uvicorn[standard]",
@@ -36,6 +39,9 @@ setup(
         "pytest",
         "pytest-asyncio",
         "click",
+        "packaging>=22.0",
+        "tomli>=1.1.0; python_version < '3.11'",
+        "importlib_resources>=1.3; python_version < '3.9'",
     ],
     extras_require={
         "dev": [
@@ -0,0 +1,12 @@
+import pytest
+from fastapi_init.scaffolder import ProjectScaffolder
+
+
+@pytest.fixture
+def scaffolded_project(tmp_path, monkeypatch):
+    """Scaffold a project under tmp_path and chdir into it; options go to create_project_scaffold."""
+    def scaffold(name="demo", **opts):
+        project_path = ProjectScaffolder().create_project_scaffold(name, base_path=tmp_path, **opts)
+        monkeypatch.chdir(project_path)
+        return project_path
+    return scaffold
@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+
+def run_check(project_path, script, env=None, args=()):
+    """Run a check script with the project's interpreter and fail with its stderr."""
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+        env={**os.environ, **(env or {})},
+    )
+    assert result.returncode == 0, result.stderr
+    return result
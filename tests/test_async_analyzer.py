@@ -1,5 +1,7 @@
 import pytest
-from fastapi_init.async_analyzer import AsyncAnalyzer
+from fastapi_init import async_analyzer
+from fastapi_init.async_analyzer import AsyncAnalyzer, CallRule, analyze_async_patterns, scan_project
+from fastapi_init.templates import render_template
 
 @pytest.fixture
 def analyzer():
@@ -41,4 +43,194 @@ def test_analyze_with_blocking_call(analyzer):
 
     result = analyzer.analyze(async_function_with_blocking_call)
     assert result['is_async'] is True
-    assert 'Blocking function detected' in result['issues']
\ No newline at end of file
+    assert 'Blocking function detected' in result['issues']
+
+
+def rules_found(code):
+    return [(finding.line, finding.rule) for finding in analyze_async_patterns(code)]
+
+
+def test_time_sleep_only_reported_inside_coroutines():
+    code = '''import time
+from time import sleep as nap
+
+# time.sleep(1) in a comment is fine
+def sync_handler():
+    time.sleep(1)
+
+async def async_handler():
+    nap(1)
+'''
+    findings = analyze_async_patterns(code, "app.py")
+    assert [(f.path, f.line, f.col, f.rule) for f in findings] == [("app.py", 9, 4, "time-sleep")]
+    assert "time.sleep" in findings[0].message
+
+
+def test_nested_sync_function_is_not_the_coroutine_body():
+    code = '''import time
+
+async def handler():
+    def work():
+        time.sleep(1)
+    return work
+'''
+    assert rules_found(code) == []
+
+
+def test_http_file_and_subprocess_calls():
+    code = '''import requests, subprocess
+from pathlib import Path
+
+async def handler():
+    requests.get("https://example.com")
+    open("data.txt").read()
+    Path("x").read_text()
+    subprocess.run(["ls"])
+'''
+    assert rules_found(code) == [(5, "sync-http"), (6, "sync-file-io"), (7, "sync-file-io"), (8, "subprocess")]
+
+
+def test_sync_session_reported_but_async_session_is_not():
+    code = '''from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+async def sync_route(db: Session):
+    return db.query(User).first()
+
+async def async_route(db: AsyncSession):
+    return await db.execute(select(User))
+'''
+    assert rules_found(code) == [(5, "sync-sqlalchemy")]
+
+
+def test_password_hashing_and_local_helpers():
+    code = '''from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"])
+
+async def login(password, hashed):
+    if check(password, hashed):
+        return pwd_context.hash(password)
+
+def check(password, hashed):
+    return verify_password(password, hashed)
+
+def verify_password(password, hashed):
+    return pwd_context.verify(password, hashed)
+'''
+    assert rules_found(code) == [(6, "password-hashing"), (7, "password-hashing")]
+
+
+def test_custom_rules_replace_the_registry():
+    code = '''import time
+
+async def handler():
+    time.sleep(1)
+    legacy.fetch()
+'''
+    rules = [CallRule("legacy", ["legacy.*"], "Blocking legacy call '{name}'")]
+    findings = analyze_async_patterns(code, rules=rules)
+    assert [(f.line, f.rule, f.message) for f in findings] == [(5, "legacy", "Blocking legacy call 'legacy.fetch'")]
+
+
+def test_generated_auth_templates_are_flagged():
+    for template in ("auth.py", "auth_router.py"):
+        source = render_template(template, project_name="demo", database_mode="sync")
+        assert "sync-sqlalchemy" in {rule for _, rule in rules_found(source)}
+
+
+def test_async_database_templates_are_not_flagged():
+    for template in ("auth.py", "auth_router.py", "health.py"):
+        source = render_template(template, project_name="demo", database_mode="async")
+        assert "sync-sqlalchemy" not in {rule for _, rule in rules_found(source)}
+
+
+BLOCKING_ROUTE = "import time\n\nasync def handler():\n    time.sleep(1)\n"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("FASTAPI_INIT_CACHE_DIR", str(tmp_path / "cache"))
+    root = tmp_path / "project"
+    (root / "app").mkdir(parents=True)
+    (root / "app" / "routes.py").write_text(BLOCKING_ROUTE)
+    (root / "app" / "sync_only.py").write_text("import time\n\ndef work():\n    time.sleep(1)\n")
+    (root / ".venv" / "lib").mkdir(parents=True)
+    (root / ".venv" / "lib" / "vendored.py").write_text(BLOCKING_ROUTE)
+    (root / "generated").mkdir()
+    (root / "generated" / "client.py").write_text(BLOCKING_ROUTE)
+    (root / "scratch.py").write_text(BLOCKING_ROUTE)
+    (root / ".gitignore").write_text("generated/\n")
+    return root
+
+
+def test_scan_honours_ignores_and_prefilter(project):
+    issues, stats = scan_project(project, exclude=["scratch.py"])
+    assert [path.relative_to(project).as_posix() for path in issues] == ["app/routes.py"]
+    assert (stats.files, stats.analyzed, stats.prefiltered, stats.cached) == (2, 1, 1, 0)
+
+
+def test_scan_cache_skips_unchanged_files(project):
+    scan_project(project)
+    issues, stats = scan_project(project)
+    assert (stats.analyzed, stats.cached) == (0, 3)
+    assert len(issues) == 2
+
+    (project / "app" / "routes.py").write_text("async def handler():\n    return 1\n")
+    issues, stats = scan_project(project)
+    assert (stats.analyzed, stats.cached) == (1, 2)
+    assert [path.name for path in issues] == ["scratch.py"]
+
+
+def test_scan_on_process_pool(project, monkeypatch):
+    monkeypatch.setattr(async_analyzer, "PARALLEL_THRESHOLD", 1)
+    issues, stats = scan_project(project, jobs=2, use_cache=False)
+    assert sorted(path.name for path in issues) == ["routes.py", "scratch.py"]
+    assert stats.files_per_second > 0
+
+
+SECURITY_MODULE = '''from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"])
+
+def verify_password(plain, hashed):
+    return pwd_context.verify(plain, hashed)
+
+def check(plain, hashed):
+    return verify_password(plain, hashed)
+
+def normalize(username):
+    return username.lower()
+'''
+
+AUTH_ROUTER = '''from app.core import security
+from app.core.security import normalize
+from ..core.users import authenticate
+
+async def login(username, password, hashed):
+    username = normalize(username)
+    if not security.verify_password(password, hashed):
+        return None
+    return authenticate(password, hashed)
+'''
+
+
+def test_scan_follows_helpers_imported_from_other_modules(tmp_path, monkeypatch):
+    monkeypatch.setenv("FASTAPI_INIT_CACHE_DIR", str(tmp_path / "cache"))
+    root = tmp_path / "project"
+    for package in ("app", "app/core", "app/api"):
+        (root / package).mkdir(parents=True)
+        (root / package / "__init__.py").write_text("")
+    (root / "app" / "core" / "security.py").write_text(SECURITY_MODULE)
+    (root / "app" / "core" / "users.py").write_text(
+        "from app.core.security import check\n\ndef authenticate(password, hashed):\n    return check(password, hashed)\n"
+    )
+    (root / "app" / "api" / "auth.py").write_text(AUTH_ROUTER)
+
+    for _ in range(2):  # the second scan runs from the cache
+        issues, _ = scan_project(root)
+        assert [path.relative_to(root).as_posix() for path in issues] == ["app/api/auth.py"]
+        findings = next(iter(issues.values()))
+        assert [(f.line, f.rule) for f in findings] == [(7, "password-hashing"), (9, "password-hashing")]
+        assert "'app.core.security.verify_password'" in findings[0].message
+        assert "'app.core.users.authenticate'" in findings[1].message
@@ -0,0 +1,87 @@
+import json
+import sys
+import pytest
+from click.testing import CliRunner
+from fastapi_init import bench
+from fastapi_init.cli import cli
+
+MAIN = '''
+from fastapi import FastAPI
+from pydantic import BaseModel, Field
+
+app = FastAPI()
+
+class Item(BaseModel):
+    name: str = Field(examples=["widget"])
+
+@app.get("/")
+def root():
+    return {"ok": True}
+
+@app.get("/items/{item_id}")
+def read_item(item_id: int):
+    return {"id": item_id}
+
+@app.post("/items")
+def create_item(item: Item):
+    return item
+'''
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    pytest.importorskip("httpx")
+    (tmp_path / "benchsvc").mkdir()
+    (tmp_path / "benchsvc" / "__init__.py").write_text("")
+    (tmp_path / "benchsvc" / "main.py").write_text(MAIN)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("benchsvc")]:
+        del sys.modules[name]
+
+def test_percentile_is_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+    assert bench.percentile(values, 50) == 50.0
+    assert bench.percentile(values, 95) == 95.0
+    assert bench.percentile(values, 99) == 99.0
+    assert bench.percentile([3.0], 99) == 3.0
+
+def test_compare_flags_latency_and_peak_memory_regressions():
+    baseline = {"GET /": {"p95_ms": 1.0, "peak_kib": 10.0}, "GET /slow": {"p95_ms": 1.0, "peak_kib": 10.0}}
+    results = [
+        bench.RouteStats("GET /", 100, 200, 0.5, 1.1, 1.2, 1000.0, 10.5),
+        bench.RouteStats("GET /slow", 100, 200, 0.5, 2.0, 2.5, 500.0, 20.0),
+        bench.RouteStats("GET /new", 100, 200, 0.5, 9.0, 9.0, 100.0, 99.0),
+    ]
+    regressions = bench.compare(results, baseline, "p95_ms", max_regression=0.2, max_peak_regression=0.25)
+    assert [(regression.key, regression.metric) for regression in regressions] == [
+        ("GET /slow", "p95_ms"), ("GET /slow", "peak_kib"),
+    ]
+
+def test_discover_targets_uses_examples(project):
+    app = bench.load_app("benchsvc.main:app", project)
+    targets, skipped = bench.discover_targets(project, app)
+    by_key = {target.key: target for target in targets}
+    assert set(by_key) == {"GET /", "POST /items"}
+    assert by_key["POST /items"].body == {"name": "widget"}
+    assert skipped == ["GET /items/{item_id}: no example for item_id"]
+
+    targets, skipped = bench.discover_targets(project, app, {"GET /items/{item_id}": {"path": {"item_id": 7}}})
+    assert "/items/7" in [target.url for target in targets] and not skipped
+
+def test_bench_command_writes_then_checks_baseline(project):
+    baseline = project / "baseline.json"
+    args = ["bench", "--app", "benchsvc.main:app", "--requests", "5", "--warmup", "1", "--baseline", str(baseline)]
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    routes = json.loads(baseline.read_text())["routes"]
+    assert routes["GET /"]["status"] == 200 and routes["POST /items"]["status"] == 200
+
+    # A baseline ten times faster than reality is a regression
+    data = json.loads(baseline.read_text())
+    data["routes"]["GET /"]["p95_ms"] = -1.0
+    baseline.write_text(json.dumps(data))
+    result = CliRunner().invoke(cli, args)
+    assert result.exit_code != 0
+    assert "regression GET /: p95_ms" in result.output
@@ -1,5 +1,17 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
-from fastapi_init.cli import main
+from click.testing import CliRunner
+
+from fastapi_init.cli import LAZY_COMMANDS, cli, main
+
+# Import budget for `fastapi-init-project --help`, in microseconds of cumulative import time
+HELP_IMPORT_BUDGET_US = 150_000
+HEAVY_MODULES = ("fastapi", "starlette", "pytest", "jinja2", "sqlalchemy", "fastapi_init.commands.scaffold")
+
 
 def test_cli_init(mocker):
     mocker.patch('fastapi_init.cli.create_project_scaffold')
@@ -20,4 +32,55 @@ def test_cli_add_error_middleware(mocker):
 def test_cli_test_init(mocker):
     mocker.patch('fastapi_init.cli.setup_test_harness')
     main(["test-init"])
-    fastapi_init.cli.setup_test_harness.assert_called_once()
\ No newline at end of file
+    fastapi_init.cli.setup_test_harness.assert_called_once()
+
+
+def _import_times(code):
+    """Run ``code`` under -X importtime; return cumulative times and the final sys.modules."""
+    code += "; import sys; print('MODULES=' + ','.join(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, module = line.split("|")
+            if cumulative.strip().isdigit():
+                times[module.strip()] = int(cumulative)
+    modules = set(result.stdout.rsplit("MODULES=", 1)[1].strip().split(","))
+    return result.stdout, times, modules
+
+
+def test_help_stays_within_import_budget():
+    stdout, times, modules = _import_times("from fastapi_init.cli import cli; cli(['--help'], standalone_mode=False)")
+    assert "init" in stdout and "env-check" in stdout
+    assert not [module for module in modules if module.split(".")[0] in HEAVY_MODULES or module in HEAVY_MODULES]
+    assert times["fastapi_init.cli"] < HELP_IMPORT_BUDGET_US
+
+
+def test_commands_are_imported_on_demand():
+    _, _, modules = _import_times("from fastapi_init.cli import cli; cli(['env-check', '--help'], standalone_mode=False)")
+    assert "fastapi_init.commands.env" in modules
+    assert "fastapi_init.commands.scaffold" not in modules
+
+
+def test_init_with_async_database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(cli, ["init", "demo", "--with-database=async"])
+    assert result.exit_code == 0, result.output
+    assert "create_async_engine" in (tmp_path / "demo" / "app" / "core" / "database.py").read_text()
+
+    result = CliRunner().invoke(cli, ["init", "plain", "--with-database"])
+    assert result.exit_code == 0, result.output
+    assert "create_async_engine" not in (tmp_path / "plain" / "app" / "core" / "database.py").read_text()
+
+
+@pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+def test_lazy_help_matches_command(name):
+    # The listing shows the registered help without importing the command; keep the two in step
+    import_path, short_help = LAZY_COMMANDS[name]
+    module_name, attribute = import_path.split(":")
+    command = getattr(importlib.import_module(module_name), attribute)
+    assert short_help == command.get_short_help_str(limit=1000)
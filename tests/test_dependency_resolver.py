@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from fastapi_init import dependency_resolver
+from fastapi_init.dependency_resolver import DependencyResolver, read_requirements_file
+from fastapi_init.env_checker import EnvironmentChecker
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("FASTAPI_INIT_CACHE_DIR", str(tmp_path / "cache"))
+
+@pytest.fixture
+def resolver():
+    return DependencyResolver()
+
+def test_specifiers_and_extras(resolver):
+    assert resolver.is_satisfied("pytest>=1.0")
+    assert resolver.is_satisfied("PyTest[testing-extra-that-does-not-exist]")
+    assert not resolver.is_satisfied("pytest<1.0")
+    assert not resolver.is_satisfied("definitely-not-installed-package")
+
+def test_markers_skip_other_environments(resolver):
+    assert resolver.is_satisfied('definitely-not-installed-package; python_version < "3"')
+
+def test_read_requirements_file(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("# comment\n-r other.txt\nfastapi>=0.100  # web\n\nuvicorn[standard]\n")
+    assert read_requirements_file(requirements) == ["fastapi>=0.100", "uvicorn[standard]"]
+
+def test_check_dependencies_reads_pyproject(tmp_path):
+    (tmp_path / "requirements.txt").write_text("pytest\n")
+    (tmp_path / "pyproject.toml").write_text(
+        '[project]\nname = "demo"\ndependencies = ["definitely-not-installed-package>=1", "pytest"]\n'
+    )
+    missing = EnvironmentChecker().check_dependencies(tmp_path)
+    assert missing == ["definitely-not-installed-package>=1"]
+
+def test_repeat_runs_use_fingerprint_cache(tmp_path, mocker):
+    requirements = ["pytest", "definitely-not-installed-package"]
+    assert DependencyResolver().missing(requirements) == ["definitely-not-installed-package"]
+
+    resolver = DependencyResolver()
+    check = mocker.spy(resolver, "is_satisfied")
+    assert resolver.missing(requirements) == ["definitely-not-installed-package"]
+    check.assert_not_called()
+
+def test_cache_keeps_only_recent_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(dependency_resolver, "MAX_CACHED_RESULTS", 2)
+    resolver = DependencyResolver()
+    for name in ("first", "second", "third"):
+        resolver.missing([f"{name}-not-installed-package"])
+
+    cache = json.loads((tmp_path / "cache" / dependency_resolver.CACHE_FILE).read_text())
+    assert cache["fingerprint"] == resolver.fingerprint
+    assert sorted(cache["results"].values()) == [["second-not-installed-package"], ["third-not-installed-package"]]
@@ -1,7 +1,11 @@
+import asyncio
+from pathlib import Path
+
 import pytest
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi_init.error_middleware import ErrorMiddleware
+from fastapi_init.templates import middleware
 
 app = FastAPI()
 
@@ -31,4 +35,60 @@ def test_custom_error_response(client):
 
     response = client.get("/custom-error")
     assert response.status_code == 500
-    assert response.json() == {"detail": "Custom error occurred."}
\ No newline at end of file
+    assert response.json() == {"detail": "Custom error occurred."}
+
+
+def _run(asgi_app, path="/"):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path, "headers": []}
+    asyncio.run(asgi_app(scope, receive, send))
+    return messages
+
+
+def test_unhandled_exception_returns_json_500():
+    async def broken(scope, receive, send):
+        raise RuntimeError("boom")
+
+    messages = _run(ErrorMiddleware(broken))
+    assert messages[0]["status"] == 500
+    assert (b"content-type", b"application/json") in messages[0]["headers"]
+    assert messages[1]["body"] == b'{"detail": "An unexpected error occurred."}'
+
+
+def test_streaming_body_passes_through_unbuffered():
+    async def streaming(scope, receive, send):
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        for chunk in (b"a", b"b", b"c"):
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    messages = _run(ErrorMiddleware(streaming))
+    assert messages[0]["status"] == 404
+    assert [message.get("body") for message in messages[1:]] == [b"a", b"b", b"c", b""]
+
+
+def test_exception_after_response_started_is_reraised():
+    async def fails_mid_stream(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        _run(ErrorMiddleware(fails_mid_stream))
+
+
+def test_project_middleware_matches_template(tmp_path):
+    (tmp_path / "app").mkdir()
+    assert ErrorMiddleware().add_to_project(tmp_path)
+    generated = (tmp_path / "app" / "core" / "middleware.py").read_text()
+    assert "BaseHTTPMiddleware" not in generated
+    assert "async def __call__(self, scope, receive, send)" in generated
+    # Projects get the module the toolkit itself runs, so there is one implementation to fix
+    assert generated == Path(middleware.__file__).read_text()
+    assert issubclass(ErrorMiddleware, middleware.ErrorMiddleware)
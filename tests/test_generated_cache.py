@@ -0,0 +1,97 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+CACHING_CHECK = '''
+import asyncio
+import sqlite3
+from fastapi import FastAPI, Header
+from fastapi.testclient import TestClient
+from app.core.cache import CachedResponse, ResponseCache, ResponseCacheMiddleware, SQLiteBackend, cache_response
+
+calls = []
+app = FastAPI()
+
+@app.get("/items/{item_id}")
+@cache_response(ttl=60, vary=["accept-language"])
+def read_item(item_id: int, accept_language: str = Header("en")):
+    calls.append(item_id)
+    return {"id": item_id, "lang": accept_language}
+
+@app.get("/me")
+@cache_response(ttl=60, private=True)
+def me(authorization: str = Header("")):
+    calls.append(authorization)
+    return {"who": authorization}
+
+app.add_middleware(ResponseCacheMiddleware, cache=ResponseCache(SQLiteBackend("cache.db")))
+client = TestClient(app)
+first = client.get("/items/1")
+assert first.headers["x-cache"] == "MISS" and first.headers["vary"] == "accept-language"
+assert client.get("/items/1").headers["x-cache"] == "HIT" and calls == [1]
+etag = first.headers["etag"]
+not_modified = client.get("/items/1", headers={"if-none-match": etag})
+assert not_modified.status_code == 304 and not_modified.headers["etag"] == etag and calls == [1]
+assert client.get("/items/1", headers={"accept-language": "fr"}).json()["lang"] == "fr"
+# Callers with credentials never share entries
+assert "x-cache" not in client.get("/items/1", headers={"authorization": "Bearer a"}).headers
+for token in ("Bearer a", "Bearer b", "Bearer a"):
+    assert client.get("/me", headers={"authorization": token}).json() == {"who": token}
+stats = client.get("/cache/stats").json()
+assert stats["hits"] == 3 and stats["not_modified"] == 1 and stats["misses"] == 4, stats
+
+# Entries outlive the process's cache object
+calls.clear()
+app.user_middleware.clear()
+app.middleware_stack = None
+app.add_middleware(ResponseCacheMiddleware, cache=ResponseCache(SQLiteBackend("cache.db")))
+assert TestClient(app).get("/items/1").headers["x-cache"] == "HIT" and calls == []
+
+# Another worker holds the write lock: the response goes out, the store waits on the threadpool
+async def store_while_locked():
+    async def handler(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    backend = SQLiteBackend("locked.db")
+    middleware = ResponseCacheMiddleware(handler, cache=ResponseCache(backend, routes={"/": 60}))
+    other_worker = sqlite3.connect("locked.db", isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/report", "query_string": b"", "headers": []}
+    pending = asyncio.ensure_future(middleware(scope, None, send))
+    ticks = 0
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert ticks == 20 and not pending.done()
+    assert [message.get("body") for message in messages[1:]] == [b"ok"]
+    other_worker.execute("COMMIT")
+    await pending
+    assert backend.stats()["entries"] == 2
+
+asyncio.run(store_while_locked())
+
+# Purges run on their own thread, down to max_bytes
+small = SQLiteBackend("small.db", max_bytes=4096, purge_every=5)
+for i in range(10):
+    small.set(f"k{i}", CachedResponse(200, [], b"x" * 1024, b'"e"', 0.0), 60)
+small._purging.join()
+assert small.stats()["evictions"] > 0
+small.purge()
+assert small.stats()["bytes"] <= 4096
+'''
+
+
+def test_add_caching_generates_response_cache(scaffolded_project):
+    pytest.importorskip("pydantic_settings")
+    project_path = scaffolded_project()
+    result = CliRunner().invoke(cli, ["add-caching"])
+    assert result.exit_code == 0, result.output
+    assert (project_path / "scripts" / "bench_cache.py").is_file()
+    run_check(project_path, CACHING_CHECK)
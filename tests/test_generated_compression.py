@@ -0,0 +1,65 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+COMPRESSION_CHECK = '''
+import asyncio
+import zlib
+from app.core.compression import CompressionMiddleware, negotiate
+
+assert negotiate("gzip;q=0.5, br", ["zstd", "br", "gzip"]) in ("br", "gzip")
+assert negotiate("gzip;q=0, identity", ["gzip"]) is None
+assert negotiate("*", ["gzip"]) == "gzip"
+
+BODY = b'{"items": [' + b",".join(b'{"id": %d, "name": "item"}' % i for i in range(500)) + b"]}"
+
+def make_app(content_type=b"application/json", body=BODY, chunks=1):
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", content_type), (b"etag", b'"v1"')]})
+        size = len(body) // chunks + 1
+        for index in range(chunks):
+            await send({"type": "http.response.body", "body": body[index * size:(index + 1) * size],
+                        "more_body": index < chunks - 1})
+    return app
+
+async def request(app, accept="gzip"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", accept.encode())]}
+    await CompressionMiddleware(app, encodings=["gzip"])(scope, None, send)
+    return dict(messages[0]["headers"]), messages[1:]
+
+async def main():
+    headers, body = await request(make_app())
+    assert headers[b"content-encoding"] == b"gzip" and headers[b"vary"] == b"accept-encoding"
+    assert headers[b"etag"] == b'W/"v1"' and int(headers[b"content-length"]) == len(body[0]["body"])
+    assert zlib.decompress(body[0]["body"], 31) == BODY
+
+    # Streamed: one compressed chunk per chunk, each decodable on arrival
+    headers, body = await request(make_app(chunks=4))
+    assert b"content-length" not in headers and len(body) == 4
+    decoder = zlib.decompressobj(31)
+    first = decoder.decompress(body[0]["body"])
+    assert first and BODY.startswith(first)
+    assert first + b"".join(decoder.decompress(message["body"]) for message in body[1:]) == BODY
+
+    for app, accept in ((make_app(b"image/png"), "gzip"), (make_app(body=b"{}"), "gzip"), (make_app(), "identity")):
+        headers, body = await request(app, accept)
+        assert b"content-encoding" not in headers
+
+asyncio.run(main())
+'''
+
+
+def test_add_compression_generates_streaming_middleware(scaffolded_project):
+    pytest.importorskip("pydantic_settings")
+    project_path = scaffolded_project()
+    result = CliRunner().invoke(cli, ["add-compression"])
+    assert result.exit_code == 0, result.output
+    assert (project_path / "scripts" / "bench_compression.py").is_file()
+    run_check(project_path, COMPRESSION_CHECK)
@@ -0,0 +1,26 @@
+import pytest
+from tests.helpers import run_check
+
+HASHING_CHECK = '''
+import asyncio
+from passlib.context import CryptContext
+from app.core.hashing import password_hasher
+
+old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("secret")
+
+async def main():
+    valid, new_hash = await password_hasher.verify_and_update("secret", old_hash)
+    assert valid and new_hash.startswith("$2b$04$")
+    assert (await password_hasher.verify_and_update("secret", new_hash)) == (True, None)
+    assert (await password_hasher.verify_and_update("wrong", new_hash))[0] is False
+    assert password_hasher.stats()["completed"] == 3
+
+asyncio.run(main())
+'''
+
+
+def test_generated_hashing_rehashes_outdated_hashes(scaffolded_project):
+    for module in ("passlib", "bcrypt", "pydantic_settings"):
+        pytest.importorskip(module)
+    project_path = scaffolded_project()
+    run_check(project_path, HASHING_CHECK, env={"BCRYPT_ROUNDS": "4"})
@@ -0,0 +1,36 @@
+import pytest
+from tests.helpers import run_check
+
+LOGGING_CHECK = '''
+import json
+import logging
+import queue
+from app.core.config import settings
+from app.core import logging as app_logging
+
+settings.log_file = "logs/check.log"
+app_logging.setup_logging()
+token = app_logging.request_id_var.set("req-1")
+logging.getLogger("app").info("hello %s", "world", extra={"user_id": 7})
+app_logging.request_id_var.reset(token)
+app_logging.shutdown_logging()
+entry = json.loads(open("logs/check.log").read().splitlines()[-1])
+assert entry["message"] == "hello world" and entry["request_id"] == "req-1" and entry["user_id"] == 7
+
+# Nothing drains this queue: DEBUG is sampled once it is half full, the rest is dropped
+handler = app_logging.DroppingQueueHandler(queue.Queue(4), debug_sample_rate=2)
+logger = logging.getLogger("pressure")
+logger.propagate = False
+logger.addHandler(handler)
+logger.setLevel(logging.DEBUG)
+for level in [logging.INFO] * 2 + [logging.DEBUG] * 4 + [logging.ERROR] * 3:
+    logger.log(level, "message")
+stats = handler.stats()
+assert stats["debug_sampled_out"] == 2 and stats["dropped"] == {"ERROR": 3}, stats
+'''
+
+
+def test_generated_logging_is_queued_and_structured(scaffolded_project):
+    pytest.importorskip("pydantic_settings")
+    project_path = scaffolded_project()
+    run_check(project_path, LOGGING_CHECK)
@@ -0,0 +1,38 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+MONITORING_CHECK = '''
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.monitoring import setup_monitoring
+
+app = FastAPI()
+
+@app.get("/users/{user_id}")
+def read_user(user_id: int):
+    return {"id": user_id}
+
+setup_monitoring(app)
+client = TestClient(app)
+for user_id in range(3):
+    assert client.get(f"/users/{user_id}").status_code == 200
+assert client.get("/missing").status_code == 404
+text = client.get("/metrics").text
+assert 'http_requests_total{method="GET",route="/users/{user_id}",status="200"} 3.0' in text
+assert 'http_requests_total{method="GET",route="<unmatched>",status="404"} 1.0' in text
+assert 'http_request_duration_seconds_count{method="GET",route="/users/{user_id}"} 3.0' in text
+assert "/users/1" not in text
+'''
+
+
+def test_add_monitoring_generates_prometheus_middleware(scaffolded_project, monkeypatch):
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("prometheus_client")
+    project_path = scaffolded_project()
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    result = CliRunner().invoke(cli, ["add-monitoring"])
+    assert result.exit_code == 0, result.output
+    assert "prometheus-client" in (project_path / "requirements.txt").read_text()
+    run_check(project_path, MONITORING_CHECK)
@@ -0,0 +1,29 @@
+import pytest
+from tests.helpers import run_check
+
+PRINCIPAL_CACHE_CHECK = '''
+import time
+from app.core.principal_cache import Principal, PrincipalCache
+
+cache = PrincipalCache(maxsize=2, ttl=60)
+alice, bob = Principal(1, "alice", True, False), Principal(2, "bob", True, False)
+cache.set("t1", alice)
+cache.set("t2", bob)
+assert cache.get("t1") == alice
+cache.set("t3", bob)
+assert cache.get("t2") is None and cache.get("t3") == bob
+cache.set("expired", alice, token_exp=time.time() - 1)
+assert cache.get("expired") is None
+cache.invalidate_user(2)
+assert cache.get("t3") is None and cache.get("t1") == alice
+assert cache.stats() == {"size": 1, "hits": 3, "misses": 3, "evictions": 1}
+'''
+
+
+def test_generated_principal_cache(scaffolded_project):
+    for module in ("sqlalchemy", "pydantic_settings"):
+        pytest.importorskip(module)
+    project_path = scaffolded_project()
+    auth = (project_path / "app" / "core" / "auth.py").read_text()
+    assert "principal_cache.get(token)" in auth
+    run_check(project_path, PRINCIPAL_CACHE_CHECK)
@@ -0,0 +1,36 @@
+import pytest
+from tests.helpers import run_check
+
+PROBES_CHECK = '''
+import asyncio
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.probes import prober
+
+client = TestClient(app)
+assert client.get("/api/v1/health/readyz").status_code == 503  # no probe has run yet
+with TestClient(app) as client:
+    assert client.get("/api/v1/health/livez").json() == {"status": "alive"}
+    ready = client.get("/api/v1/health/readyz")
+    assert ready.status_code == 200 and ready.json()["checks"]["database"]["ok"], ready.text
+
+    async def hangs():
+        await asyncio.sleep(10)
+
+    prober.timeout = 0.1
+    prober.register("hangs", hangs)
+    client.portal.call(prober.run_checks)
+    payload = client.get("/api/v1/health/readyz").json()
+    assert payload["status"] == "not ready"
+    assert payload["checks"]["hangs"]["error"].startswith("timed out")
+    assert payload["checks"]["hangs"]["latency_ms"] >= 100
+'''
+
+
+@pytest.mark.parametrize("database_mode", ["sync", "async"])
+def test_readiness_is_served_from_background_probes(scaffolded_project, database_mode):
+    pytest.importorskip("pydantic_settings")
+    if database_mode == "async":
+        pytest.importorskip("aiosqlite")
+    project_path = scaffolded_project(database_mode=database_mode)
+    run_check(project_path, PROBES_CHECK, env={"DATABASE_CREATE_ALL": "true"})
@@ -0,0 +1,71 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+PROFILING_CHECK = '''
+import os
+import tempfile
+import time
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core import profiling
+
+
+def crunch():
+    end = time.perf_counter() + 0.05
+    while time.perf_counter() < end:
+        sum(range(100))
+
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+async def read_item(item_id: int):
+    crunch()
+    return {}
+
+
+@app.get("/report")
+def report():
+    crunch()
+    return {}
+
+
+directory = tempfile.mkdtemp()
+profiler = profiling.Profiler(directory=directory, interval_ms=1)
+app.add_middleware(profiling.ProfilingMiddleware, profiler=profiler, sample_rate=0.0)
+client = TestClient(app)
+token = profiling.profile_token()
+assert profiling.valid_token(token) and not profiling.valid_token("1." + token.partition(".")[2])
+assert client.get("/items/1").status_code == 200
+assert client.get("/items/1", headers={"X-Profile": token[:-1]}).status_code == 200
+assert not profiler.routes
+
+for path in ("/items/1", "/items/2", "/report"):
+    assert client.get(path, headers={"X-Profile": token}).status_code == 200
+assert set(profiler.routes) == {("GET", "/items/{item_id}"), ("GET", "/report")}
+items = profiler.collapsed("GET", "/items/{item_id}")
+assert any(";read_item (" in line and ";crunch (" in line for line in items), items
+report = profiler.collapsed("GET", "/report")
+assert any(line.startswith("[threadpool];report (") and ";crunch (" in line for line in report), report
+
+profiler.flush()
+files = sorted(os.listdir(directory))
+assert files == [f"GET_items_item_id.{os.getpid()}.folded", f"GET_report.{os.getpid()}.folded"], files
+for name in files:
+    for line in open(os.path.join(directory, name)):
+        stack, _, count = line.rstrip("\\n").rpartition(" ")
+        assert stack and int(count) > 0, line
+'''
+
+
+def test_add_profiling_generates_sampling_profiler(scaffolded_project):
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("httpx")
+    project_path = scaffolded_project()
+    result = CliRunner().invoke(cli, ["add-profiling"])
+    assert result.exit_code == 0, result.output
+    assert (project_path / "scripts" / "bench_profiling.py").is_file()
+    run_check(project_path, PROFILING_CHECK)
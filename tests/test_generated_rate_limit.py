@@ -0,0 +1,68 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+RATE_LIMIT_CHECK = '''
+import asyncio
+import sqlite3
+from app.core.rate_limit import MemoryStorage, RateLimit, RateLimitMiddleware, SQLiteStorage
+
+limit = RateLimit.parse("2/second")
+memory = MemoryStorage(max_keys=2)
+assert [memory.hit("a", limit, now=0).allowed for _ in range(3)] == [True, True, False]
+assert memory.hit("a", limit, now=0.5).allowed and not memory.hit("a", limit, now=0.5).allowed
+memory.hit("b", limit, now=0.5)
+memory.hit("c", limit, now=0.5)
+assert len(memory) == 2
+
+# Two storages on one file behave like two workers sharing a limit
+first, second = SQLiteStorage("shared.db"), SQLiteStorage("shared.db")
+assert first.hit("ip", limit, now=100).allowed and second.hit("ip", limit, now=100).allowed
+decision = first.hit("ip", limit, now=100)
+assert not decision.allowed and decision.retry_after == 0.5
+
+async def app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+middleware = RateLimitMiddleware(app, default="100/minute", routes={"/api/v1/auth": "1/minute"})
+
+async def request(path):
+    messages = []
+    async def send(message):
+        messages.append(message)
+    await middleware({"type": "http", "path": path, "client": ("1.2.3.4", 1)}, None, send)
+    return messages[0]
+
+async def main():
+    assert (await request("/api/v1/auth/token"))["status"] == 200
+    rejected = await request("/api/v1/auth/token")
+    assert rejected["status"] == 429 and (b"retry-after", b"60") in rejected["headers"]
+    allowed = await request("/api/v1/items")
+    assert allowed["status"] == 200 and (b"x-ratelimit-remaining", b"99") in allowed["headers"]
+
+    # Another worker holds the write lock: the hit waits on the threadpool, the loop keeps running
+    middleware.storage = SQLiteStorage("shared.db")
+    other_worker = sqlite3.connect("shared.db", isolation_level=None)
+    other_worker.execute("BEGIN IMMEDIATE")
+    pending = asyncio.ensure_future(request("/api/v1/items"))
+    ticks = 0
+    for _ in range(20):
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert ticks == 20 and not pending.done()
+    other_worker.execute("COMMIT")
+    assert (await pending)["status"] == 200
+
+asyncio.run(main())
+'''
+
+
+def test_add_rate_limiting_generates_token_bucket_limiter(scaffolded_project):
+    pytest.importorskip("pydantic_settings")
+    project_path = scaffolded_project()
+    result = CliRunner().invoke(cli, ["add-rate-limiting"])
+    assert result.exit_code == 0, result.output
+    assert (project_path / "scripts" / "bench_rate_limit.py").is_file()
+    run_check(project_path, RATE_LIMIT_CHECK)
@@ -0,0 +1,81 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+RESOURCE_CHECK = '''
+import asyncio
+import json
+import os
+os.environ["DATABASE_URL"] = os.environ["CHECK_DATABASE_URL"]
+import httpx
+from sqlalchemy import event
+from app.core.database import engine
+from app.main import app
+
+async def main():
+    statements = []
+    event.listen(getattr(engine, "sync_engine", engine), "before_cursor_execute", lambda *a: statements.append(a[2]))
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://t") as client:
+            for i in range(25):
+                response = await client.post("/api/v1/products", json={"name": f"p{i % 4}", "notes": "long"})
+                assert response.status_code == 201, response.text
+            response = await client.post("/api/v1/product-reviews", json={"rating": 4, "product_id": 3})
+            assert response.status_code == 201 and response.json()["product"]["name"] == "p2", response.text
+
+            for sort in ("id", "-id", "name", "-created_at"):
+                seen, cursor = [], None
+                while True:
+                    statements.clear()
+                    params = {"sort": sort, "limit": 10, **({"cursor": cursor} if cursor else {})}
+                    page = (await client.get("/api/v1/products", params=params)).json()
+                    assert len(statements) == 1, statements
+                    assert all("notes" not in item for item in page["items"])
+                    seen += [item["id"] for item in page["items"]]
+                    cursor = page["next_cursor"]
+                    if cursor is None:
+                        break
+                assert sorted(seen) == list(range(1, 26)), (sort, seen)
+            ordered = [(item["name"], item["id"]) for item in (await client.get("/api/v1/products?sort=name&limit=100")).json()["items"]]
+            assert ordered == sorted(ordered)
+
+            first = (await client.get("/api/v1/products", params={"sort": "name", "limit": 5})).json()
+            response = await client.get("/api/v1/products", params={"sort": "id", "cursor": first["next_cursor"]})
+            assert response.status_code == 400
+            assert (await client.patch("/api/v1/products/1", json={"name": "z"})).json()["name"] == "z"
+            assert (await client.delete("/api/v1/products/2")).status_code == 204
+            assert (await client.get("/api/v1/products/2")).status_code == 404
+
+            rows = "\\n".join(json.dumps({"name": f"bulk {i}"}) for i in range(2500)) + "\\n\\n"
+            response = await client.post("/api/v1/products/bulk", content=rows.encode())
+            assert response.status_code == 201 and response.json() == {"inserted": 2500}, response.text
+            response = await client.post("/api/v1/products/bulk", content=b'{"name": "kept?"}\\n{"notes": 1}\\n')
+            assert response.status_code == 422 and response.json()["detail"]["line"] == 2
+            exported = [json.loads(line) for line in (await client.get("/api/v1/products/export")).text.splitlines()]
+            assert len(exported) == 2524 and exported[-1]["name"] == "bulk 2499" and "created_at" in exported[-1]
+            assert [row["id"] for row in exported] == sorted(row["id"] for row in exported)
+
+asyncio.run(main())
+'''
+
+
+@pytest.mark.parametrize("database_mode", ["sync", "async"])
+def test_generate_resource_pages_by_keyset(scaffolded_project, tmp_path, database_mode):
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("httpx")
+    if database_mode == "async":
+        pytest.importorskip("aiosqlite")
+    project_path = scaffolded_project(database_mode=database_mode)
+    runner = CliRunner()
+    result = runner.invoke(cli, ["generate", "resource", "Product", "--field", "name:str:index", "--field", "notes:text:optional", "--bulk"])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(cli, ["generate", "resource", "ProductReview", "--field", "rating:int:index", "--belongs-to", "Product"])
+    assert result.exit_code == 0, result.output
+    assert "products_router" in (project_path / "app" / "api" / "v1" / "router.py").read_text()
+    assert (project_path / "scripts" / "bench_products_bulk.py").is_file()
+    assert runner.invoke(cli, ["generate", "resource", "Product"]).exit_code != 0
+
+    driver = "sqlite+aiosqlite" if database_mode == "async" else "sqlite"
+    env = {"CHECK_DATABASE_URL": f"{driver}:///{tmp_path / 'check.db'}", "DATABASE_CREATE_ALL": "true"}
+    run_check(project_path, RESOURCE_CHECK, env=env)
@@ -0,0 +1,40 @@
+import pytest
+from tests.helpers import run_check
+
+FAST_JSON_CHECK = '''
+import json
+from datetime import datetime, timezone
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from app.core.responses import FastJSONResponse, model_response
+from app.main import app
+from app.models.models import User as UserModel
+from app.schemas.schemas import User
+
+assert app.router.default_response_class is FastJSONResponse
+created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+rows = [
+    UserModel(id=i, email=f"u{i}@example.com", username=f"u{i}", hashed_password="x",
+              is_active=True, is_superuser=False, created_at=created, updated_at=None)
+    for i in range(3)
+]
+expected = jsonable_encoder([User.model_validate(row) for row in rows])
+for response in (model_response(List[User], rows), model_response(List[User], rows, validate=True)):
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == expected
+assert json.loads(model_response(User, expected[0]).body) == expected[0]
+assert json.loads(FastJSONResponse({"when": 1}).body) == {"when": 1}
+'''
+
+
+def test_fast_json_scaffold(scaffolded_project):
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("orjson")
+    plain = scaffolded_project("plain")
+    assert not (plain / "app" / "core" / "responses.py").exists()
+    assert "orjson" not in (plain / "requirements.txt").read_text()
+
+    project_path = scaffolded_project(fast_json=True)
+    assert (project_path / "scripts" / "bench_json.py").is_file()
+    assert "orjson" in (project_path / "requirements.txt").read_text()
+    run_check(project_path, FAST_JSON_CHECK)
@@ -0,0 +1,68 @@
+import importlib.util
+import pytest
+from click.testing import CliRunner
+from fastapi_init.cli import cli
+from tests.helpers import run_check
+
+SERVER_PROFILE_CHECK = '''
+import tempfile
+from pathlib import Path
+from app.core import server
+from app.core.config import settings
+
+root = Path(tempfile.mkdtemp())
+assert server.cgroup_cpu_limit(root) is None
+(root / "cpu").mkdir()
+(root / "cpu" / "cpu.cfs_quota_us").write_text("150000\\n")
+(root / "cpu" / "cpu.cfs_period_us").write_text("100000\\n")
+assert server.cgroup_cpu_limit(root) == 1.5
+(root / "cpu.max").write_text("max 100000\\n")
+assert server.cgroup_cpu_limit(root) is None
+(root / "cpu.max").write_text("400000 100000\\n")
+assert server.cgroup_cpu_limit(root) == 4.0
+
+assert server.worker_count() >= 1
+settings.web_workers = 3
+assert server.worker_count() == 3
+options = server.uvicorn_options()
+assert options["backlog"] == settings.web_backlog and options["limit_concurrency"] is None
+'''
+
+
+GUNICORN_WORKER_CHECK = '''
+from app.core import server
+
+options = server.uvicorn_options()
+kwargs = server.TunedUvicornWorker.CONFIG_KWARGS
+assert kwargs["loop"] == options["loop"] and kwargs["http"] == options["http"]
+assert kwargs["limit_concurrency"] == options["limit_concurrency"]
+# gunicorn applies these from gunicorn.conf.py, with max-requests jitter
+assert not {"backlog", "timeout_keep_alive", "limit_max_requests"} & set(kwargs)
+'''
+
+
+def test_server_profiles(scaffolded_project, monkeypatch):
+    pytest.importorskip("pydantic_settings")
+    gunicorn = scaffolded_project("gunicorn_app", server_profile="gunicorn")
+    assert (gunicorn / "gunicorn.conf.py").is_file()
+    assert "gunicorn.conf.py" in (gunicorn / "Dockerfile").read_text()
+    assert "gunicorn" in (gunicorn / "requirements.txt").read_text()
+    if importlib.util.find_spec("gunicorn"):
+        run_check(gunicorn, GUNICORN_WORKER_CHECK)
+
+    project_path = scaffolded_project(server_profile="uvicorn")
+    assert not (project_path / "gunicorn.conf.py").exists()
+    assert "app.core.server" in (project_path / "Makefile").read_text()
+    run_check(project_path, SERVER_PROFILE_CHECK)
+
+    # docker-setup writes the same Dockerfile as init, for the profile in use
+    for project in (gunicorn, project_path):
+        dockerfile = (project / "Dockerfile").read_text()
+        (project / "Dockerfile").unlink()
+        monkeypatch.chdir(project)
+        result = CliRunner().invoke(cli, ["docker-setup"])
+        assert result.exit_code == 0, result.output
+        assert (project / "Dockerfile").read_text() == dockerfile
+
+    with pytest.raises(ValueError):
+        scaffolded_project("bad", server_profile="waitress")
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+import pytest
+from tests.helpers import run_check
+
+STARTUP_CHECK = '''
+import asyncio
+import sys
+from app.core import startup
+from app.core.database import engine
+from app.main import app
+
+calls = []
+
+
+@startup.warmup
+def fill_cache():
+    calls.append("sync")
+
+
+@startup.warmup
+async def load_model():
+    calls.append("async")
+
+
+@startup.warmup
+def broken():
+    raise RuntimeError("boom")
+
+
+async def main(expected):
+    try:
+        async with app.router.lifespan_context(app):
+            assert app.openapi_schema is not None
+            assert sorted(calls) == ["async", "sync"]
+            pool = getattr(engine, "sync_engine", engine).pool
+            assert pool.checkedin() == pool.size(), pool.status()
+    except startup.SchemaError as e:
+        assert expected in str(e), e
+        return
+    assert expected == "ready"
+
+asyncio.run(main(sys.argv[1]))
+'''
+
+
+@pytest.mark.parametrize("database_mode", ["sync", "async"])
+def test_startup_checks_alembic_heads_and_warms_up(scaffolded_project, tmp_path, database_mode):
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("alembic")
+    if database_mode == "async":
+        pytest.importorskip("aiosqlite")
+    project_path = scaffolded_project(database_mode=database_mode)
+    env = {"DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}"}
+
+    def alembic(*args):
+        result = subprocess.run(
+            [sys.executable, "-m", "alembic", *args], cwd=project_path, capture_output=True, text=True,
+            env={**os.environ, **env},
+        )
+        assert result.returncode == 0, result.stderr
+
+    run_check(project_path, STARTUP_CHECK, env=env, args=["no Alembic revisions"])
+    alembic("revision", "--autogenerate", "-m", "init")
+    run_check(project_path, STARTUP_CHECK, env=env, args=["alembic upgrade head"])
+    alembic("upgrade", "head")
+    run_check(project_path, STARTUP_CHECK, env=env, args=["ready"])
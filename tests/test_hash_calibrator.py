@@ -0,0 +1,34 @@
+import pytest
+from click.testing import CliRunner
+from fastapi_init import hash_calibrator
+from fastapi_init.cli import cli
+from fastapi_init.utils import update_env_file
+
+def test_update_env_file_replaces_and_appends(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("# Security\nSECRET_KEY=abc\nbcrypt_rounds=12\n")
+    update_env_file(env_file, {"BCRYPT_ROUNDS": "13", "PASSWORD_HASH_SCHEME": "bcrypt"})
+    assert env_file.read_text() == "# Security\nSECRET_KEY=abc\nBCRYPT_ROUNDS=13\nPASSWORD_HASH_SCHEME=bcrypt\n"
+
+def test_calibrate_bcrypt_stops_before_overshooting(monkeypatch):
+    pytest.importorskip("bcrypt")
+    # Pretend 10 rounds take 60 ms; every extra round doubles that
+    timings = iter(60.0 * 2 ** step for step in range(10))
+    monkeypatch.setattr(hash_calibrator, "measure_ms", lambda func, samples: next(timings))
+    result = hash_calibrator.calibrate_bcrypt(target_ms=250)
+    assert result.settings == {"bcrypt_rounds": 12}
+    assert result.hash_ms == 240.0
+    assert result.env_values() == {"PASSWORD_HASH_SCHEME": "bcrypt", "BCRYPT_ROUNDS": "12"}
+
+def test_auto_calibrate_writes_env_file(tmp_path, monkeypatch):
+    result = hash_calibrator.CalibrationResult("bcrypt", {"bcrypt_rounds": 11}, 180.0)
+    monkeypatch.setitem(hash_calibrator.CALIBRATORS, "bcrypt", lambda target_ms: result)
+    env_file = tmp_path / ".env"
+
+    outcome = CliRunner().invoke(cli, ["auto-calibrate", "--env-file", str(env_file), "--dry-run"])
+    assert outcome.exit_code == 0, outcome.output
+    assert "BCRYPT_ROUNDS=11" in outcome.output and not env_file.exists()
+
+    outcome = CliRunner().invoke(cli, ["auto-calibrate", "--env-file", str(env_file)])
+    assert outcome.exit_code == 0, outcome.output
+    assert env_file.read_text() == "PASSWORD_HASH_SCHEME=bcrypt\nBCRYPT_ROUNDS=11\n"
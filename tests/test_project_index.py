@@ -0,0 +1,159 @@
+import time
+import pytest
+from fastapi_init.onboarding import OnboardingReport
+from fastapi_init.project_index import ProjectIndex
+
+MAIN = '''
+from fastapi import FastAPI, Depends
+from app.api.router import api_router
+from app.deps import verify_key
+
+app = FastAPI()
+app.include_router(api_router, prefix="/api", dependencies=[Depends(verify_key)])
+
+@app.get("/")
+def root():
+    """Landing page."""
+    return {}
+'''
+
+ROUTER = '''
+from fastapi import APIRouter
+from .items import router as items_router
+from . import users
+
+api_router = APIRouter()
+api_router.include_router(items_router, prefix="/items")
+api_router.include_router(users.router)
+'''
+
+ITEMS = '''
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from app.deps import get_db, get_user
+
+router = APIRouter()
+
+@router.get("/{item_id}")
+async def read_item(item_id: int, db=Depends(get_db)):
+    return {}
+
+@router.api_route("/", methods=["GET", "POST"])
+async def items(user: Annotated[dict, Depends(get_user)]):
+    return {}
+'''
+
+USERS = '''
+import fastapi
+
+router = fastapi.APIRouter(prefix="/users", tags=["users"])
+
+@router.delete("/{user_id}")
+async def delete_user(user_id: int):
+    return None
+'''
+
+DEPS = '''
+from fastapi import Depends
+
+def get_db():
+    yield None
+
+def get_user(db=Depends(get_db)):
+    return {}
+
+def verify_key():
+    return True
+'''
+
+ORPHAN = '''
+from fastapi import APIRouter
+
+router = APIRouter()
+
+@router.get("/lost")
+async def lost():
+    return {}
+'''
+
+@pytest.fixture
+def project(tmp_path):
+    files = {
+        "app/__init__.py": "",
+        "app/main.py": MAIN,
+        "app/deps.py": DEPS,
+        "app/api/__init__.py": "",
+        "app/api/router.py": ROUTER,
+        "app/api/items.py": ITEMS,
+        "app/api/users.py": USERS,
+        "app/api/orphan.py": ORPHAN,
+        "tests/test_main.py": "def test_ok():\n    pass\n",
+        "requirements.txt": "fastapi\n",
+    }
+    for rel_path, content in files.items():
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+def test_resolves_include_chains(project):
+    index = ProjectIndex.build(project)
+    routes = {(route.method, route.path): route for route in index.routes}
+
+    assert set(routes) == {
+        ("GET", "/"),
+        ("GET", "/api/items/{item_id}"),
+        ("GET", "/api/items/"),
+        ("POST", "/api/items/"),
+        ("DELETE", "/api/users/{user_id}"),
+    }
+    assert routes[("GET", "/")].is_async is False
+    assert routes[("GET", "/")].description == "Landing page."
+    assert routes[("GET", "/api/items/{item_id}")].handler == "read_item"
+    assert index.unmounted_routers == ["app.api.orphan.router"]
+
+def test_records_depends_chain(project):
+    index = ProjectIndex.build(project)
+    routes = {(route.method, route.path): route for route in index.routes}
+
+    assert routes[("GET", "/api/items/{item_id}")].dependencies == ("app.deps.verify_key", "app.deps.get_db")
+    assert routes[("POST", "/api/items/")].dependencies == (
+        "app.deps.verify_key", "app.deps.get_user", "app.deps.get_db",
+    )
+    assert routes[("GET", "/")].dependencies == ()
+
+def test_report_uses_index(project):
+    report = OnboardingReport().generate_report(project)
+
+    assert "`DELETE /api/users/{user_id}`" in report
+    assert "depends on verify_key -> get_user -> get_db" in report
+    assert "Router app.api.orphan.router is never included in an app" in report
+    assert "- test_main.py" in report
+    assert "1 route handler(s) are sync" in report
+
+def test_large_project_indexes_quickly(tmp_path):
+    (tmp_path / "app" / "routers").mkdir(parents=True)
+    imports, includes = [], []
+    for module in range(60):
+        handlers = "".join(
+            f'@router.get("/r{route}")\nasync def handler_{route}(db=Depends(get_db)):\n    return {{}}\n\n'
+            for route in range(15)
+        )
+        (tmp_path / "app" / "routers" / f"m{module}.py").write_text(
+            "from fastapi import APIRouter, Depends\nfrom app.deps import get_db\n\n"
+            f"router = APIRouter(prefix='/m{module}')\n\n{handlers}"
+        )
+        imports.append(f"from app.routers import m{module}")
+        includes.append(f"app.include_router(m{module}.router)")
+    (tmp_path / "app" / "deps.py").write_text("def get_db():\n    yield None\n")
+    (tmp_path / "app" / "main.py").write_text(
+        "from fastapi import FastAPI\n" + "\n".join(imports) + "\napp = FastAPI()\n" + "\n".join(includes) + "\n"
+    )
+
+    start = time.perf_counter()
+    report = OnboardingReport().generate_report(tmp_path)
+    elapsed = time.perf_counter() - start
+
+    assert report.count("`GET /m") == 900
+    assert "`GET /m59/r14`" in report
+    assert elapsed < 1.0
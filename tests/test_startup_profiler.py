@@ -0,0 +1,66 @@
+import json
+import pytest
+from click.testing import CliRunner
+from fastapi_init import startup_profiler
+from fastapi_init.cli import cli
+
+MAIN = '''
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+
+def slow_setup():
+    time.sleep(0.05)
+
+@asynccontextmanager
+async def lifespan(app):
+    slow_setup()
+    yield
+
+app = FastAPI(lifespan=lifespan)
+
+@app.get("/ping")
+def ping():
+    import wave  # deferred until the first request
+    return {"ok": True}
+'''
+
+def test_parse_importtime_tags_each_import_with_its_phase():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 | encodings",
+        "-- startup phase: import",
+        "import time:      2000 |       2500 |   pydantic.fields",
+        "import time:       500 |       3000 | pydantic",
+        "import time:      1500 |       1500 | app.main",
+        "-- startup phase: first_request",
+        "import time:       250 |        250 | colorsys",
+    ])
+    records = startup_profiler.parse_importtime(stderr)
+    assert [(record.module, record.phase) for record in records] == [
+        ("encodings", "interpreter"), ("pydantic.fields", "import"), ("pydantic", "import"),
+        ("app.main", "import"), ("colorsys", "first_request"),
+    ]
+    assert records[1].self_ms == 2.0 and records[1].cumulative_ms == 2.5
+
+
+def test_profile_startup_reports_phases_lines_and_imports(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    (tmp_path / "startsvc").mkdir()
+    (tmp_path / "startsvc" / "__init__.py").write_text("")
+    (tmp_path / "startsvc" / "main.py").write_text(MAIN)
+    monkeypatch.chdir(tmp_path)
+    result = CliRunner().invoke(cli, ["profile-startup", "--app", "startsvc.main:app", "--runs", "1", "--top", "100", "--json"])
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)
+    assert data["path"] == "/ping" and data["status"] == 200
+    assert set(data["phases_ms"]) >= {"import", "lifespan", "openapi", "first_request"}
+    assert data["phases_ms"]["lifespan"] >= 50
+    assert data["lifespan_lines"][0]["source"] == "slow_setup()" and data["lifespan_lines"][0]["ms"] >= 50
+    assert data["imports_ms_by_phase"]["first_request"] > 0
+    names = [group["name"] for group in data["imports"]]
+    assert "fastapi" in names and "startsvc.main" in names
+
+    result = CliRunner().invoke(cli, ["profile-startup", "--app", "startsvc.main:app", "--runs", "1"])
+    assert result.exit_code == 0, result.output
+    assert "startsvc/main.py:11" in result.output and "ready (import + lifespan)" in result.output
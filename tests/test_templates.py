@@ -0,0 +1,69 @@
+import os
+import pytest
+from fastapi_init import templates
+from fastapi_init.scaffolder import ProjectScaffolder
+
+
+def test_environment_is_shared():
+    assert ProjectScaffolder().template_env is ProjectScaffolder().template_env
+    assert templates.get_template_env() is ProjectScaffolder().template_env
+
+
+def test_templates_load_from_package_data():
+    loader = templates.get_template_env().loader
+    assert "main.py" in loader.list_templates()
+    assert ".gitignore" in loader.list_templates()
+    assert templates.TEMPLATES["config.py"] == loader.get_source(None, "config.py")[0]
+
+
+def test_render_template():
+    content = templates.render_template("config.py", project_name="demo_api")
+    assert 'app_name: str = "demo_api"' in content
+    assert content.endswith("\n")
+
+
+def test_bytecode_cache_is_written(tmp_path, monkeypatch):
+    # A fresh Environment whose bytecode cache lives under tmp_path, not ~/.cache
+    monkeypatch.setenv("FASTAPI_INIT_CACHE_DIR", str(tmp_path))
+    templates.get_template_env.cache_clear()
+    try:
+        env = templates.get_template_env()
+        env.get_template("README.md")
+        assert env.bytecode_cache.directory == str(tmp_path / "jinja")
+        assert any(name.endswith(".cache") for name in os.listdir(tmp_path / "jinja"))
+    finally:
+        templates.get_template_env.cache_clear()
+
+
+def test_scaffold_writes_all_files(scaffolded_project):
+    project_path = scaffolded_project()
+    for relative in ("app/main.py", "app/core/config.py", "alembic/env.py", "alembic/script.py.mako", ".gitignore"):
+        assert (project_path / relative).is_file()
+    for python_file in project_path.rglob("*.py"):
+        compile(python_file.read_text(), str(python_file), "exec")
+
+
+@pytest.mark.parametrize("database_mode", ["sync", "async"])
+def test_scaffold_database_modes(scaffolded_project, database_mode):
+    project_path = scaffolded_project(database_mode=database_mode)
+    for python_file in project_path.rglob("*.py"):
+        compile(python_file.read_text(), str(python_file), "exec")
+
+    database = (project_path / "app" / "core" / "database.py").read_text()
+    auth = (project_path / "app" / "core" / "auth.py").read_text()
+    requirements = (project_path / "requirements.txt").read_text()
+    config = (project_path / "app" / "core" / "config.py").read_text()
+    assert "db_pool_size: int" in config and "db_pool_pre_ping: bool" in config
+    if database_mode == "async":
+        assert "create_async_engine" in database and "async def get_db" in database
+        assert "await db.execute(query)" in auth
+        assert "aiosqlite" in requirements and "asyncpg" in requirements
+        assert "run_sync(do_run_migrations)" in (project_path / "alembic" / "env.py").read_text()
+    else:
+        assert "create_async_engine" not in database and "row = db.execute(query)" in auth
+        assert "aiosqlite" not in requirements
+
+
+def test_scaffold_rejects_unknown_database_mode(scaffolded_project):
+    with pytest.raises(ValueError):
+        scaffolded_project(database_mode="mongo")
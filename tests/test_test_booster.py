@@ -1,4 +1,9 @@
+import subprocess
+import sys
+
 import pytest
+from fastapi_init.scaffolder import ProjectScaffolder
+from fastapi_init.templates import render_template
 from fastapi_init.test_booster import TestBooster
 
 @pytest.fixture
@@ -16,4 +21,38 @@ def test_booster_integration(test_booster):
     assert test_booster.integrate_with_fastapi() is True
 
 def test_cleanup(test_booster):
-    assert test_booster.cleanup() is True
\ No newline at end of file
+    assert test_booster.cleanup() is True
+
+
+ROLLBACK_TESTS = '''
+import pytest
+from sqlalchemy import func, select
+from app.models.models import User
+
+@pytest.mark.parametrize("n", range(3))
+async def test_commits_are_rolled_back(db_session, n):
+    count = select(func.count()).select_from(User)
+    result = db_session.scalar(count)
+    assert (await result if hasattr(result, "__await__") else result) == 0
+    db_session.add(User(email=f"user{n}@example.com", username="user", hashed_password="x"))
+    committed = db_session.commit()
+    if hasattr(committed, "__await__"):
+        await committed
+'''
+
+
+@pytest.mark.parametrize("database_mode", ["sync", "async"])
+def test_generated_suite_runs_with_rollback(tmp_path, database_mode):
+    pytest.importorskip("pydantic_settings")
+    pytest.importorskip("pytest_asyncio")
+    if database_mode == "async":
+        pytest.importorskip("aiosqlite")
+    project_path = ProjectScaffolder().create_project_scaffold("demo", base_path=tmp_path, database_mode=database_mode)
+    assert TestBooster().setup_tests(project_path) is True
+    assert (project_path / "pytest.ini").read_text() == render_template("pytest.ini")
+    (project_path / "tests" / "test_rollback.py").write_text(ROLLBACK_TESTS)
+
+    run = subprocess.run([sys.executable, "-m", "pytest", "-q"], cwd=project_path, capture_output=True, text=True)
+    assert run.returncode == 0, run.stdout + run.stderr
+    assert "7 passed" in run.stdout
+    assert not (project_path / "app.db").exists()